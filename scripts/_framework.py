@@ -0,0 +1,152 @@
+"""Declarative workflow framework for the capture scripts.
+
+Every capture script used to repeat the same ~30 lines: StateManager setup,
+the start_url metadata merge, an inner capture_step closure, and the
+end_workflow call. run_workflow() owns that boilerplate once, so a script
+is reduced to a list of Step declarations plus the actions themselves.
+"""
+
+import asyncio
+import base64
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional
+
+from playwright.async_api import Page
+
+from _runner import VIEWPORT, wait_for_grid  # noqa: F401  (re-exported for script use)
+from core.state_manager import StateManager
+from utils import LazyScreenshot
+
+
+@dataclass
+class Step:
+    """One captured workflow step: an optional browser action plus annotation.
+
+    `do` receives the page and may return a value; when the reasoning string
+    contains `{result}` it is formatted with that return value, which keeps
+    dynamic verification text in the step table.
+    """
+    action_type: str
+    description: str
+    target: str
+    reasoning: str
+    do: Optional[Callable[[Page], Awaitable[Any]]] = None
+
+
+async def run_workflow(
+    page: Page,
+    task_id: str,
+    task_query: str,
+    app_name: str,
+    start_url: str,
+    steps: List[Step],
+    settle: Optional[Callable[[Page, Optional[str]], Awaitable[str]]] = None
+):
+    """Run a declarative list of steps, capturing a screenshot after each one.
+
+    When `settle` is given (e.g. `wait_for_grid`) it is awaited after every
+    step action so captures happen as soon as the page has settled rather
+    than after a fixed sleep.
+    """
+    state_manager = StateManager()
+    state_manager.start_workflow(app_name, task_id, task_query, start_url=start_url)
+
+    fingerprint = await settle(page, None) if settle else None
+
+    # CDP's Page.captureScreenshot with fromSurface=false returns the last
+    # rasterized frame without waiting for compositor sync, noticeably
+    # faster than page.screenshot(). CDP sessions are Chromium-only, so the
+    # probe runs once per workflow and everything else falls back.
+    cdp = {"session": None, "probed": False}
+
+    async def take_screenshot() -> bytes:
+        if not cdp["probed"]:
+            cdp["probed"] = True
+            browser = page.context.browser
+            if browser is not None and browser.browser_type.name == "chromium":
+                try:
+                    cdp["session"] = await page.context.new_cdp_session(page)
+                except Exception:
+                    cdp["session"] = None
+        if cdp["session"] is not None:
+            result = await cdp["session"].send("Page.captureScreenshot", {
+                "format": "jpeg",
+                "quality": 80,
+                "fromSurface": False,
+                "captureBeyondViewport": False
+            })
+            return base64.b64decode(result["data"])
+        return await page.screenshot(
+            clip={"x": 0, "y": 0, **VIEWPORT},
+            type="jpeg",
+            quality=80
+        )
+
+    # Cheap DOM+scroll hash: when it matches the previous capture the page
+    # has not visibly changed, so the prior screenshot can be reused. The
+    # hash, title, and URL come back from one evaluate instead of three
+    # driver round-trips per capture.
+    last_capture = {"hash": None, "image": None}
+
+    page_meta_js = (
+        "() => ({"
+        " hash: document.body.innerHTML.length + ':' + window.scrollX + ',' + window.scrollY,"
+        " title: document.title,"
+        " url: location.href"
+        "})"
+    )
+
+    # StateManager.capture_step does a PIL save plus a metadata rewrite, all
+    # synchronous disk I/O. Run each one in a worker thread, chained so step
+    # numbering stays sequential, while the loop moves on to the next action.
+    pending_writes: List[asyncio.Task] = []
+
+    def schedule_write(**kwargs):
+        previous = pending_writes[-1] if pending_writes else None
+
+        async def write():
+            if previous is not None:
+                await previous
+            await asyncio.to_thread(state_manager.capture_step, **kwargs)
+
+        pending_writes.append(asyncio.create_task(write()))
+
+    async def capture_step(step: Step, result: Any):
+        meta = await page.evaluate(page_meta_js)
+        if meta["hash"] == last_capture["hash"] and last_capture["image"] is not None:
+            image = last_capture["image"]
+        else:
+            screenshot_bytes = await take_screenshot()
+            image = LazyScreenshot(screenshot_bytes, format="jpeg")
+            last_capture["hash"] = meta["hash"]
+            last_capture["image"] = image
+        reasoning = step.reasoning
+        if "{result}" in reasoning:
+            reasoning = reasoning.format(result=result)
+        schedule_write(
+            screenshot=image,
+            description=step.description,
+            action_type=step.action_type,
+            action_target=step.target,
+            url=meta["url"],
+            reasoning=reasoning,
+            metadata={
+                "difference": 1.0,
+                "reason": "Manual capture",
+                "page_title": meta["title"]
+            }
+        )
+
+    for step in steps:
+        result = None
+        if step.do is not None:
+            result = await step.do(page)
+            if settle:
+                fingerprint = await settle(page, fingerprint)
+        await capture_step(step, result)
+
+    if pending_writes:
+        await asyncio.gather(*pending_writes)
+    # end_workflow rewrites metadata and renders the README synchronously;
+    # keep that off the loop too so parallel workflows are not stalled.
+    await asyncio.to_thread(state_manager.end_workflow, success=True)
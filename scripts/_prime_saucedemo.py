@@ -0,0 +1,39 @@
+"""Log into SauceDemo once and persist the session for the capture scripts.
+
+Run this before a batch so the three SauceDemo scripts can reach the
+inventory page straight from the saved storage state; when the state file
+is missing or stale they fall back to logging in through the form.
+
+Usage:
+    python scripts/_prime_saucedemo.py
+"""
+
+from _runner import get_browser, run, shutdown, storage_state_path
+
+LOGIN_URL = "https://www.saucedemo.com/"
+USERNAME = "standard_user"
+PASSWORD = "secret_sauce"
+
+
+async def prime():
+    browser = await get_browser()
+    context = await browser.new_context()
+    page = await context.new_page()
+    try:
+        await page.goto(LOGIN_URL, wait_until="commit")
+        await page.wait_for_selector("#user-name")
+        await page.fill("#user-name", USERNAME)
+        await page.fill("#password", PASSWORD)
+        await page.click("#login-button")
+        await page.wait_for_selector(".inventory_item", timeout=5000)
+        path = storage_state_path("saucedemo")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await context.storage_state(path=str(path))
+        print(f"Saved SauceDemo session to {path}")
+    finally:
+        await context.close()
+        await shutdown()
+
+
+if __name__ == "__main__":
+    run(prime())
@@ -0,0 +1,382 @@
+"""Shared Playwright runner for the capture scripts.
+
+Launching a browser is the dominant cost of every capture script (seconds
+per run). This module keeps a single browser per process and hands out
+isolated contexts/pages through a small pool, so a batch of scripts pays
+the cold start once instead of once per script.
+"""
+
+import asyncio
+import re
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional
+
+from playwright.async_api import Browser, Page, async_playwright
+
+try:
+    import uvloop
+except ImportError:  # optional speedup; the stdlib loop works fine
+    uvloop = None
+
+# Fallback for checkouts where the package is not `pip install -e .`'d;
+# guarded so repeated imports never grow sys.path.
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+_STATE_DIR = Path(__file__).resolve().parent / ".state"
+
+# Warm Chromium profile for standalone script runs: its on-disk HTTP cache,
+# compiled-JS cache, and cookies survive across process invocations.
+_PROFILE_DIR = _STATE_DIR / "profile"
+
+
+def storage_state_path(name: str) -> Path:
+    """Path where a named Playwright storage state is persisted."""
+    return _STATE_DIR / f"{name}.json"
+
+# Analytics and ad-tracker requests none of the captures need. Routing only
+# these URLs (rather than **/*) keeps every other request out of the Python
+# interception path; fonts and images stay loaded since the screenshots are
+# the deliverable.
+_BLOCKLIST_RE = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|segment\.io|sentry\.io"
+    r"|doubleclick\.net|facebook\.net"
+)
+
+
+async def install_blocklist(context):
+    """Abort analytics/tracker requests for every page in the context."""
+    await context.route(_BLOCKLIST_RE, lambda route: route.abort())
+
+
+# The AG Grid demo is usable the moment its first row is attached, well
+# before `networkidle` (analytics beacons keep the network busy for a while).
+AG_GRID_READY = ".ag-center-cols-container [row-index='0']"
+
+# Captures are consumed by humans and vision models; 1x pixels at 720p are
+# plenty and halve the bytes pushed through the encoder on every screenshot.
+VIEWPORT = {"width": 1280, "height": 720}
+
+# Browser RSS creeps up over long batch runs even with per-task contexts,
+# so the shared process is recycled once it has served enough pages or
+# lived long enough. Recycling only happens when no contexts are open, so live
+# captures are never interrupted.
+_MAX_PAGES_PER_BROWSER = 200
+_MAX_BROWSER_AGE = 30 * 60  # seconds
+
+# Chromium over WebKit: lower per-command latency through CDP, a faster
+# screenshot path (including the Page.captureScreenshot fast path in the
+# framework), and these flags trim GPU/background work in headless runs.
+_LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+]
+
+_playwright = None
+_browser: Optional[Browser] = None
+_browser_lock = asyncio.Lock()
+_pages_served = 0
+_browser_started_at = 0.0
+
+
+def _browser_expired() -> bool:
+    if _pages_served >= _MAX_PAGES_PER_BROWSER:
+        return True
+    return asyncio.get_event_loop().time() - _browser_started_at >= _MAX_BROWSER_AGE
+
+
+async def get_browser() -> Browser:
+    """Return the shared Chromium browser, launching it on first use.
+
+    A browser past its page or age budget is closed and relaunched before
+    being handed out, provided it has no open contexts.
+    """
+    global _playwright, _browser, _pages_served, _browser_started_at
+
+    async with _browser_lock:
+        if _browser is not None and _browser_expired() and not _browser.contexts:
+            await _browser.close()
+            _browser = None
+        if _browser is None:
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(
+                headless=True, args=_LAUNCH_ARGS
+            )
+            _pages_served = 0
+            _browser_started_at = asyncio.get_event_loop().time()
+        _pages_served += 1
+    return _browser
+
+
+async def launch_persistent_context():
+    """Launch a context backed by the warm on-disk profile.
+
+    Used by standalone (one-script-per-process) runs, where the shared
+    in-process browser cannot amortize anything; the persistent profile
+    carries the HTTP cache and cookies between invocations instead.
+    """
+    global _playwright
+
+    async with _browser_lock:
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+    _PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    return await _playwright.chromium.launch_persistent_context(
+        str(_PROFILE_DIR),
+        headless=True,
+        args=_LAUNCH_ARGS,
+        viewport=VIEWPORT,
+        device_scale_factor=1
+    )
+
+
+async def shutdown():
+    """Close the shared browser and stop Playwright."""
+    global _playwright, _browser
+
+    async with _browser_lock:
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
+
+class PagePool:
+    """Pool of ready-to-use pages backed by the shared browser.
+
+    Each page lives in its own context so concurrent tasks stay isolated.
+    Idle pages are kept in a queue and reused; `acquire()` navigates the
+    page to the pool's start URL before handing it out and clears cookies
+    when it comes back.
+    """
+
+    def __init__(
+        self,
+        start_url: str,
+        size: int = 4,
+        wait_until: str = "networkidle",
+        reuse_pages: bool = True,
+        storage_state_name: Optional[str] = None,
+        ready_selector: Optional[str] = None,
+        persistent: bool = False
+    ):
+        self.start_url = start_url
+        self.size = size
+        self.wait_until = wait_until
+        self.reuse_pages = reuse_pages
+        self.ready_selector = ready_selector
+        self.persistent = persistent
+        self.storage_state_path: Optional[Path] = (
+            storage_state_path(storage_state_name) if storage_state_name else None
+        )
+        self._state_saved = bool(
+            self.storage_state_path and self.storage_state_path.exists()
+        )
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._created = 0
+        self._lock = asyncio.Lock()
+
+    async def _new_page(self) -> Page:
+        """Create a fresh page in its own context, reusing saved storage state."""
+        if self.persistent:
+            # One warm on-disk profile; the profile itself persists cookies,
+            # so the storage-state file is not applied on top of it.
+            context = await launch_persistent_context()
+        else:
+            browser = await get_browser()
+            context_kwargs = {"viewport": VIEWPORT, "device_scale_factor": 1}
+            if self._state_saved:
+                context_kwargs["storage_state"] = str(self.storage_state_path)
+            context = await browser.new_context(**context_kwargs)
+        await install_blocklist(context)
+        # Persistent contexts come with an initial blank page; use it.
+        page = context.pages[0] if context.pages else await context.new_page()
+        # Fail fast on hung navigations rather than Playwright's 30 s default.
+        page.set_default_navigation_timeout(15000)
+        return page
+
+    async def _save_storage_state(self, page: Page):
+        """Persist cookies/localStorage once so later contexts skip the warm-up."""
+        if not self.storage_state_path or self._state_saved:
+            return
+        try:
+            _STATE_DIR.mkdir(parents=True, exist_ok=True)
+            await page.context.storage_state(path=str(self.storage_state_path))
+            self._state_saved = True
+        except Exception:
+            # Best effort: a failed save just means the next run warms up again
+            pass
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Yield a page navigated to the start URL, returning it afterwards."""
+        async with self._lock:
+            if self._idle.empty() and self._created < self.size:
+                self._created += 1
+                page = await self._new_page()
+            else:
+                page = None
+
+        if page is None:
+            page = await self._idle.get()
+
+        try:
+            await page.goto(self.start_url, wait_until=self.wait_until)
+            if self.ready_selector:
+                # Gate on the element the scripts actually need instead of
+                # waiting out the networkidle grace period.
+                await page.wait_for_selector(
+                    self.ready_selector, state="attached", timeout=10000
+                )
+            await self._save_storage_state(page)
+        except Exception:
+            # A failed warm-up must not leak the page: close it and free
+            # its slot, or once _created hits size every later acquire()
+            # blocks forever on an empty idle queue.
+            try:
+                await page.context.close()
+            except Exception:
+                pass
+            async with self._lock:
+                self._created -= 1
+            raise
+
+        try:
+            yield page
+        finally:
+            if self.reuse_pages:
+                # State-backed and persistent pools keep their session
+                # cookies; clearing them would log the reused page back out.
+                if self.storage_state_path is None and not self.persistent:
+                    await page.context.clear_cookies()
+                await self._idle.put(page)
+            else:
+                await page.context.close()
+                async with self._lock:
+                    self._created -= 1
+
+    async def close(self):
+        """Close all idle pages and their contexts."""
+        while not self._idle.empty():
+            page = self._idle.get_nowait()
+            await page.context.close()
+        self._created = 0
+
+
+_GRID_FINGERPRINT_JS = """
+() => {
+    const rows = document.querySelectorAll('.ag-center-cols-container [row-index]');
+    const headers = document.querySelectorAll('.ag-header-cell');
+    return rows.length + ':' + headers.length + ':' + (rows[0] ? rows[0].textContent : '');
+}
+"""
+
+
+async def wait_for_grid(page: Page, prev_hash: Optional[str] = None, timeout: int = 1500) -> str:
+    """Wait for the AG Grid to settle after an action and return its fingerprint.
+
+    Polls a cheap DOM fingerprint (row count, header count, first row text)
+    and returns as soon as it differs from `prev_hash`, instead of sleeping
+    a fixed amount. With no `prev_hash` the current fingerprint is returned
+    immediately. Polling starts at 50 ms and backs off to 200 ms; on timeout
+    the latest fingerprint is returned so captures can proceed.
+    """
+    deadline = asyncio.get_event_loop().time() + timeout / 1000
+    interval = 0.05
+
+    while True:
+        current = await page.evaluate(_GRID_FINGERPRINT_JS)
+        if prev_hash is None or current != prev_hash:
+            return current
+        if asyncio.get_event_loop().time() >= deadline:
+            return current
+        await asyncio.sleep(interval)
+        interval = min(interval * 2, 0.2)
+
+
+_GRID_API_JS = """
+([columnState, quickFilter]) => {
+    const api = window.gridApi
+        || (window.agGrid && window.agGrid.instances && window.agGrid.instances[0]
+            && window.agGrid.instances[0].api);
+    if (!api) return false;
+    if (quickFilter !== null && quickFilter !== undefined) {
+        if (api.setGridOption) api.setGridOption('quickFilterText', quickFilter);
+        else api.setQuickFilter(quickFilter);
+    }
+    if (columnState) {
+        const hasSort = columnState.some(s => 'sort' in s);
+        api.applyColumnState(
+            hasSort
+                ? { state: columnState, defaultState: { sort: null } }
+                : { state: columnState }
+        );
+    }
+    return true;
+}
+"""
+
+
+async def apply_grid_state(page: Page, column_state=None, quick_filter=None) -> bool:
+    """Apply AG Grid column state and/or quick filter through the grid API.
+
+    The demo page exposes its grid API on `window`, so pin/sort/filter can
+    be applied in one evaluate instead of a chain of menu hovers and
+    synthetic clicks. Returns False when the API is unavailable so callers
+    can fall back to regular UI interaction.
+    """
+    try:
+        return bool(await page.evaluate(_GRID_API_JS, [column_state, quick_filter]))
+    except Exception:
+        return False
+
+
+async def run_capture(
+    task_fn,
+    start_url: str,
+    wait_until: str = "networkidle",
+    storage_state_name: Optional[str] = None,
+    ready_selector: Optional[str] = None
+):
+    """Run a single capture task against a pooled page.
+
+    `task_fn` receives a page already navigated to `start_url`. When used
+    standalone (one script per process) this also shuts the browser down
+    on exit; batch runners should use a `PagePool` directly and call
+    `shutdown()` once at the end.
+    """
+    pool = PagePool(
+        start_url,
+        size=1,
+        wait_until=wait_until,
+        storage_state_name=storage_state_name,
+        ready_selector=ready_selector,
+        persistent=True
+    )
+    try:
+        async with pool.acquire() as page:
+            await task_fn(page)
+    finally:
+        await pool.close()
+        await shutdown()
+
+
+def run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    Playwright's driver traffic is many small reads/writes, which is
+    exactly where uvloop's event loop helps; scripts use this instead of
+    calling asyncio.run directly.
+    """
+    if uvloop is not None:
+        uvloop.install()
+    return asyncio.run(coro)
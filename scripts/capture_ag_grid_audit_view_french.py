@@ -1,15 +1,5 @@
-import asyncio
-import io
-import json
-from pathlib import Path
-import sys
-
-from PIL import Image
-from playwright.async_api import async_playwright
-
-sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
-
-from core.state_manager import StateManager
+from _framework import Step, run_workflow
+from _runner import AG_GRID_READY, apply_grid_state, run, run_capture, wait_for_grid
 
 
 TASK_ID = "ag_grid_audit_view_french"
@@ -18,84 +8,69 @@ APP_NAME = "Linear"
 START_URL = "https://www.ag-grid.com/example/"
 
 
-async def main():
-    state_manager = StateManager()
-    workflow_path = state_manager.start_workflow(APP_NAME, TASK_ID, TASK_QUERY)
-
-    metadata_path = workflow_path / "metadata.json"
-    metadata = json.loads(metadata_path.read_text())
-    metadata["start_url"] = START_URL
-    metadata_path.write_text(json.dumps(metadata, indent=2))
-
-    async with async_playwright() as pw:
-        browser = await pw.webkit.launch(headless=True)
-        page = await browser.new_page()
-        await page.goto(START_URL, wait_until="networkidle")
-
-        async def capture_step(action_type: str, description: str, target: str, reasoning: str):
-            screenshot_bytes = await page.screenshot(full_page=False)
-            image = Image.open(io.BytesIO(screenshot_bytes))
-            state_manager.capture_step(
-                screenshot=image,
-                description=description,
-                action_type=action_type,
-                action_target=target,
-                url=page.url,
-                reasoning=reasoning,
-                metadata={
-                    "difference": 1.0,
-                    "reason": "Manual capture",
-                    "page_title": await page.title()
-                }
-            )
-
-        await capture_step(
-            action_type="navigate",
-            description="Opened AG Grid demo landing page",
-            target=START_URL,
-            reasoning="Baseline grid before building the audit view"
-        )
-
-        quick_filter = page.locator("#global-filter")
-        await quick_filter.fill("French")
-        await quick_filter.press("Enter")
-        await page.wait_for_timeout(800)
-        await capture_step(
-            action_type="filter",
-            description="Applied global quick filter for 'French'",
-            target="#global-filter",
-            reasoning="Focused the grid on rows containing the term 'French'"
-        )
-
-        menu_button = page.locator("div[col-id='language'] .ag-header-cell-menu-button").first
-        await menu_button.click()
-        await page.locator(".ag-menu-option:has-text('Pin Column')").first.hover()
-        await page.wait_for_timeout(200)
-        await page.locator(".ag-menu-option:has-text('Pin Left')").first.click()
-        await page.wait_for_timeout(800)
-        await capture_step(
-            action_type="pin",
-            description="Pinned the Language column to the left",
-            target="Language column menu",
-            reasoning="Keeps Language visible while auditing filtered data"
-        )
-
-        balance_header = page.locator(".ag-header-cell[col-id='bankBalance']").first
-        await balance_header.click()
-        await balance_header.click()
-        await page.wait_for_timeout(800)
-        await capture_step(
-            action_type="sort",
-            description="Sorted Bank Balance column descending",
-            target="Bank Balance header",
-            reasoning="Shows highest balances at the top of the filtered, pinned view"
-        )
-
-        await browser.close()
-
-    state_manager.end_workflow(success=True)
+async def apply_quick_filter(page):
+    quick_filter = page.locator("#global-filter")
+    await quick_filter.fill("French")
+    await quick_filter.press("Enter")
+
+
+async def pin_language_left(page):
+    if await apply_grid_state(page, column_state=[{"colId": "language", "pinned": "left"}]):
+        return
+    menu_button = page.locator("div[col-id='language'] .ag-header-cell-menu-button").first
+    await menu_button.click()
+    await page.locator(".ag-menu-option:has-text('Pin Column')").first.hover()
+    await page.locator(".ag-menu-option:has-text('Pin Left')").first.click()
+
+
+async def sort_balance_descending(page):
+    if await apply_grid_state(page, column_state=[{"colId": "bankBalance", "sort": "desc"}]):
+        return
+    balance_header = page.locator(".ag-header-cell[col-id='bankBalance']").first
+    # Both clicks in one evaluate: a single round-trip instead of two
+    await balance_header.evaluate("el => { el.click(); el.click(); }")
+
+
+STEPS = [
+    Step(
+        action_type="navigate",
+        description="Opened AG Grid demo landing page",
+        target=START_URL,
+        reasoning="Baseline grid before building the audit view"
+    ),
+    Step(
+        action_type="filter",
+        description="Applied global quick filter for 'French'",
+        target="#global-filter",
+        reasoning="Focused the grid on rows containing the term 'French'",
+        do=apply_quick_filter
+    ),
+    Step(
+        action_type="pin",
+        description="Pinned the Language column to the left",
+        target="Language column menu",
+        reasoning="Keeps Language visible while auditing filtered data",
+        do=pin_language_left
+    ),
+    Step(
+        action_type="sort",
+        description="Sorted Bank Balance column descending",
+        target="Bank Balance header",
+        reasoning="Shows highest balances at the top of the filtered, pinned view",
+        do=sort_balance_descending
+    ),
+]
+
+
+async def main(page):
+    await run_workflow(page, TASK_ID, TASK_QUERY, APP_NAME, START_URL, STEPS, settle=wait_for_grid)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
-
+    run(run_capture(
+        main,
+        START_URL,
+        wait_until="domcontentloaded",
+        storage_state_name="ag_grid",
+        ready_selector=AG_GRID_READY
+    ))
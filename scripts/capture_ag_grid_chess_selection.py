@@ -1,15 +1,5 @@
-import asyncio
-import io
-import json
-from pathlib import Path
-import sys
-
-from PIL import Image
-from playwright.async_api import async_playwright
-
-sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
-
-from core.state_manager import StateManager
+from _framework import Step, run_workflow
+from _runner import AG_GRID_READY, run, run_capture, wait_for_grid
 
 
 TASK_ID = "ag_grid_game_chess_selection"
@@ -18,74 +8,53 @@ APP_NAME = "Linear"
 START_URL = "https://www.ag-grid.com/example/"
 
 
-async def main():
-    state_manager = StateManager()
-    workflow_path = state_manager.start_workflow(APP_NAME, TASK_ID, TASK_QUERY)
-
-    metadata_path = workflow_path / "metadata.json"
-    metadata = json.loads(metadata_path.read_text())
-    metadata["start_url"] = START_URL
-    metadata_path.write_text(json.dumps(metadata, indent=2))
-
-    async with async_playwright() as pw:
-        browser = await pw.webkit.launch(headless=True)
-        page = await browser.new_page()
-        await page.goto(START_URL, wait_until="networkidle")
-
-        async def capture_step(action_type: str, description: str, target: str, reasoning: str):
-            screenshot_bytes = await page.screenshot(full_page=False)
-            image = Image.open(io.BytesIO(screenshot_bytes))
-            state_manager.capture_step(
-                screenshot=image,
-                description=description,
-                action_type=action_type,
-                action_target=target,
-                url=page.url,
-                reasoning=reasoning,
-                metadata={
-                    "difference": 1.0,
-                    "reason": "Manual capture",
-                    "page_title": await page.title()
-                }
-            )
-
-        await capture_step(
-            action_type="navigate",
-            description="Opened AG Grid example landing page",
-            target=START_URL,
-            reasoning="Initial state before filtering for Chess"
-        )
-
-        game_input = page.locator("input[aria-label='Game Name Filter Input']:not([disabled])").first
-        await game_input.click()
-        await game_input.fill("Chess")
-        await game_input.press("Enter")
-        await page.wait_for_timeout(1000)
-
-        await capture_step(
-            action_type="filter",
-            description="Filtered Game Name column to rows containing 'Chess'",
-            target="Game Name floating filter input",
-            reasoning="Typed 'Chess' into the floating filter and pressed Enter"
-        )
-
-        checkboxes = page.locator(".ag-selection-checkbox input")
-        for i in range(3):
-            await checkboxes.nth(i).check()
-        await page.wait_for_timeout(500)
-
-        await capture_step(
-            action_type="select",
-            description="Selected first three filtered rows with Game Name containing 'Chess'",
-            target="Row selection checkboxes",
-            reasoning="Checked the first three row selection boxes after filtering"
-        )
-
-        await browser.close()
-
-    state_manager.end_workflow(success=True)
+async def filter_chess_games(page):
+    game_input = page.locator("input[aria-label='Game Name Filter Input']:not([disabled])").first
+    await game_input.click()
+    await game_input.fill("Chess")
+    await game_input.press("Enter")
+
+
+async def select_top_three(page):
+    # Resolve the checkboxes once instead of re-querying per nth() call
+    checkboxes = await page.query_selector_all(".ag-selection-checkbox input")
+    for checkbox in checkboxes[:3]:
+        await checkbox.check()
+
+
+STEPS = [
+    Step(
+        action_type="navigate",
+        description="Opened AG Grid example landing page",
+        target=START_URL,
+        reasoning="Initial state before filtering for Chess"
+    ),
+    Step(
+        action_type="filter",
+        description="Filtered Game Name column to rows containing 'Chess'",
+        target="Game Name floating filter input",
+        reasoning="Typed 'Chess' into the floating filter and pressed Enter",
+        do=filter_chess_games
+    ),
+    Step(
+        action_type="select",
+        description="Selected first three filtered rows with Game Name containing 'Chess'",
+        target="Row selection checkboxes",
+        reasoning="Checked the first three row selection boxes after filtering",
+        do=select_top_three
+    ),
+]
+
+
+async def main(page):
+    await run_workflow(page, TASK_ID, TASK_QUERY, APP_NAME, START_URL, STEPS, settle=wait_for_grid)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
-
+    run(run_capture(
+        main,
+        START_URL,
+        wait_until="domcontentloaded",
+        storage_state_name="ag_grid",
+        ready_selector=AG_GRID_READY
+    ))
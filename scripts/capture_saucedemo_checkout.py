@@ -1,15 +1,7 @@
 import asyncio
-import io
-import json
-from pathlib import Path
-import sys
 
-from PIL import Image
-from playwright.async_api import async_playwright
-
-sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
-
-from core.state_manager import StateManager
+from _framework import Step, run_workflow
+from _runner import run, run_capture
 
 
 TASK_ID = "saucedemo_checkout_flow"
@@ -20,84 +12,94 @@ USERNAME = "standard_user"
 PASSWORD = "secret_sauce"
 
 
-async def main():
-    state_manager = StateManager()
-    workflow_path = state_manager.start_workflow(APP_NAME, TASK_ID, TASK_QUERY)
-
-    metadata_path = workflow_path / "metadata.json"
-    metadata = json.loads(metadata_path.read_text())
-    metadata["start_url"] = START_URL
-    metadata_path.write_text(json.dumps(metadata, indent=2))
-
-    async with async_playwright() as pw:
-        browser = await pw.webkit.launch(headless=True)
-        page = await browser.new_page()
-        await page.goto(START_URL, wait_until="networkidle")
-
-        async def capture_step(action_type: str, description: str, target: str, reasoning: str):
-            screenshot_bytes = await page.screenshot(full_page=False)
-            image = Image.open(io.BytesIO(screenshot_bytes))
-            state_manager.capture_step(
-                screenshot=image,
-                description=description,
-                action_type=action_type,
-                action_target=target,
-                url=page.url,
-                reasoning=reasoning,
-                metadata={
-                    "difference": 1.0,
-                    "reason": "Manual capture",
-                    "page_title": await page.title()
-                }
-            )
-
-        await page.fill("#user-name", USERNAME)
-        await page.fill("#password", PASSWORD)
-        await page.click("#login-button")
-        await page.wait_for_selector(".inventory_item", timeout=5000)
-        await page.locator("button[data-test='add-to-cart-sauce-labs-backpack']").click()
-        await page.locator("button[data-test='add-to-cart-sauce-labs-bike-light']").click()
-        await capture_step(
-            action_type="prepare",
-            description="Added Backpack and Bike Light prior to checkout",
-            target="Inventory grid buttons",
-            reasoning="Cart now has two items before starting checkout"
-        )
-
-        await page.locator(".shopping_cart_link").click()
-        await page.click("#checkout")
-        await page.fill("#first-name", "Agent")
-        await page.fill("#last-name", "Smith")
-        await page.fill("#postal-code", "12345")
-        await capture_step(
-            action_type="form",
-            description="Filled checkout information with Agent Smith 12345",
-            target="Checkout form",
-            reasoning="Ready to continue to order summary"
-        )
-
-        await page.click("#continue")
-        await capture_step(
-            action_type="summary",
-            description="Viewed order summary before finishing",
-            target="Checkout overview",
-            reasoning="Verifying items and totals before completion"
-        )
-
-        await page.click("#finish")
-        await page.wait_for_selector(".complete-header", timeout=5000)
-        await capture_step(
-            action_type="confirmation",
-            description="Finished order and saw 'Thank You' message",
-            target="Thank you screen",
-            reasoning="Confirms checkout completion with success banner"
-        )
-
-        await browser.close()
-
-    state_manager.end_workflow(success=True)
+INVENTORY_URL = "https://www.saucedemo.com/inventory.html"
+
+
+async def log_in(page):
+    """Reach the inventory page, preferring a primed session over the form."""
+    await page.goto(INVENTORY_URL, wait_until="commit")
+    try:
+        await page.wait_for_selector(".inventory_item", timeout=2000)
+        return
+    except Exception:
+        pass
+    await page.goto(START_URL, wait_until="commit")
+    await page.wait_for_selector("#user-name")
+    await page.fill("#user-name", USERNAME)
+    await page.fill("#password", PASSWORD)
+    await page.click("#login-button")
+    await page.wait_for_selector(".inventory_item", timeout=5000)
+
+
+async def prepare_cart(page):
+    await log_in(page)
+    await asyncio.gather(
+        page.locator("button[data-test='add-to-cart-sauce-labs-backpack']").click(),
+        page.locator("button[data-test='add-to-cart-sauce-labs-bike-light']").click(),
+    )
+
+
+async def fill_checkout_info(page):
+    await page.locator(".shopping_cart_link").click()
+    await page.click("#checkout")
+    # Independent form fields; one gather instead of three serialized fills.
+    await asyncio.gather(
+        page.fill("#first-name", "Agent"),
+        page.fill("#last-name", "Smith"),
+        page.fill("#postal-code", "12345"),
+    )
+
+
+async def continue_to_summary(page):
+    await page.click("#continue")
+
+
+async def finish_order(page):
+    await page.click("#finish")
+    await page.wait_for_selector(".complete-header", timeout=5000)
+
+
+STEPS = [
+    Step(
+        action_type="prepare",
+        description="Added Backpack and Bike Light prior to checkout",
+        target="Inventory grid buttons",
+        reasoning="Cart now has two items before starting checkout",
+        do=prepare_cart
+    ),
+    Step(
+        action_type="form",
+        description="Filled checkout information with Agent Smith 12345",
+        target="Checkout form",
+        reasoning="Ready to continue to order summary",
+        do=fill_checkout_info
+    ),
+    Step(
+        action_type="summary",
+        description="Viewed order summary before finishing",
+        target="Checkout overview",
+        reasoning="Verifying items and totals before completion",
+        do=continue_to_summary
+    ),
+    Step(
+        action_type="confirmation",
+        description="Finished order and saw 'Thank You' message",
+        target="Thank you screen",
+        reasoning="Confirms checkout completion with success banner",
+        do=finish_order
+    ),
+]
+
+
+async def main(page):
+    await run_workflow(page, TASK_ID, TASK_QUERY, APP_NAME, START_URL, STEPS)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
-
+    run(run_capture(
+        main,
+        START_URL,
+        wait_until="commit",
+        storage_state_name="saucedemo",
+        ready_selector="#user-name, .inventory_item"
+    ))
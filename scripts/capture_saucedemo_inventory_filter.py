@@ -1,15 +1,5 @@
-import asyncio
-import io
-import json
-from pathlib import Path
-import sys
-
-from PIL import Image
-from playwright.async_api import async_playwright
-
-sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
-
-from core.state_manager import StateManager
+from _framework import Step, run_workflow
+from _runner import run, run_capture
 
 
 TASK_ID = "saucedemo_inventory_filter"
@@ -20,79 +10,84 @@ USERNAME = "standard_user"
 PASSWORD = "secret_sauce"
 
 
-async def main():
-    state_manager = StateManager()
-    workflow_path = state_manager.start_workflow(APP_NAME, TASK_ID, TASK_QUERY)
-
-    metadata_path = workflow_path / "metadata.json"
-    metadata = json.loads(metadata_path.read_text())
-    metadata["start_url"] = START_URL
-    metadata_path.write_text(json.dumps(metadata, indent=2))
-
-    async with async_playwright() as pw:
-        browser = await pw.webkit.launch(headless=True)
-        page = await browser.new_page()
-        await page.goto(START_URL, wait_until="networkidle")
-
-        async def capture_step(action_type: str, description: str, target: str, reasoning: str):
-            screenshot_bytes = await page.screenshot(full_page=False)
-            image = Image.open(io.BytesIO(screenshot_bytes))
-            state_manager.capture_step(
-                screenshot=image,
-                description=description,
-                action_type=action_type,
-                action_target=target,
-                url=page.url,
-                reasoning=reasoning,
-                metadata={
-                    "difference": 1.0,
-                    "reason": "Manual capture",
-                    "page_title": await page.title()
-                }
-            )
-
-        await page.fill("#user-name", USERNAME)
-        await page.fill("#password", PASSWORD)
-        await page.click("#login-button")
-        await page.wait_for_selector(".inventory_item", timeout=5000)
-        await capture_step(
-            action_type="login",
-            description="Logged in and reached inventory list",
-            target="Inventory container",
-            reasoning="Baseline before sorting"
-        )
-
-        await page.select_option(".product_sort_container", value="hilo")
-        await page.wait_for_timeout(500)
-        await capture_step(
-            action_type="sort",
-            description="Sorted inventory by price high to low",
-            target="Sorting dropdown",
-            reasoning="Inventory order now shows most expensive items first"
-        )
-
-        last_add_button = page.locator(".inventory_item").last.locator("button")
-        await last_add_button.click()
-        await capture_step(
-            action_type="add-to-cart",
-            description="Added the cheapest item after sorting",
-            target="Last item's Add to Cart button",
-            reasoning="Demonstrates grabbing the least expensive product from the sorted view"
-        )
-
-        await page.locator(".shopping_cart_link").click()
-        await capture_step(
-            action_type="cart",
-            description="Viewed cart to confirm cheapest item was added",
-            target="Cart page",
-            reasoning="Cart badge and line item confirm the action"
-        )
-
-        await browser.close()
-
-    state_manager.end_workflow(success=True)
+INVENTORY_URL = "https://www.saucedemo.com/inventory.html"
+
+
+async def log_in(page):
+    """Reach the inventory page, preferring a primed session over the form."""
+    await page.goto(INVENTORY_URL, wait_until="commit")
+    try:
+        await page.wait_for_selector(".inventory_item", timeout=2000)
+        return
+    except Exception:
+        pass
+    await page.goto(START_URL, wait_until="commit")
+    await page.wait_for_selector("#user-name")
+    await page.fill("#user-name", USERNAME)
+    await page.fill("#password", PASSWORD)
+    await page.click("#login-button")
+    await page.wait_for_selector(".inventory_item", timeout=5000)
+
+
+async def sort_by_price(page):
+    first_item = await page.locator(".inventory_item_name").first.text_content()
+    await page.select_option(".product_sort_container", value="hilo")
+    await page.wait_for_function(
+        "prev => document.querySelector('.inventory_item_name').textContent !== prev",
+        arg=first_item,
+        timeout=5000
+    )
+
+
+async def add_cheapest_item(page):
+    await page.locator(".inventory_item").last.locator("button").click()
+
+
+async def open_cart(page):
+    await page.locator(".shopping_cart_link").click()
+
+
+STEPS = [
+    Step(
+        action_type="login",
+        description="Logged in and reached inventory list",
+        target="Inventory container",
+        reasoning="Baseline before sorting",
+        do=log_in
+    ),
+    Step(
+        action_type="sort",
+        description="Sorted inventory by price high to low",
+        target="Sorting dropdown",
+        reasoning="Inventory order now shows most expensive items first",
+        do=sort_by_price
+    ),
+    Step(
+        action_type="add-to-cart",
+        description="Added the cheapest item after sorting",
+        target="Last item's Add to Cart button",
+        reasoning="Demonstrates grabbing the least expensive product from the sorted view",
+        do=add_cheapest_item
+    ),
+    Step(
+        action_type="cart",
+        description="Viewed cart to confirm cheapest item was added",
+        target="Cart page",
+        reasoning="Cart badge and line item confirm the action",
+        do=open_cart
+    ),
+]
+
+
+async def main(page):
+    await run_workflow(page, TASK_ID, TASK_QUERY, APP_NAME, START_URL, STEPS)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
-
+    run(run_capture(
+        main,
+        START_URL,
+        wait_until="commit",
+        storage_state_name="saucedemo",
+        ready_selector="#user-name, .inventory_item"
+    ))
@@ -0,0 +1,100 @@
+"""Run the capture scripts concurrently against one shared browser.
+
+Running each script as its own process pays interpreter start plus a
+WebKit launch every time. This runner imports every converted script's
+`main(page)` and executes them under a single event loop with a bounded
+semaphore, sharing the browser through per-URL page pools.
+
+Usage:
+    python scripts/run_all.py [concurrency]
+"""
+
+import asyncio
+import sys
+
+import capture_ag_grid_audit_view
+import capture_ag_grid_audit_view_french
+import capture_ag_grid_audit_view_spanish
+import capture_ag_grid_chess_group
+import capture_ag_grid_chess_selection
+import capture_ag_grid_column_toggle
+import capture_ag_grid_filter
+import capture_ag_grid_pin_language
+import capture_ag_grid_quick_filter
+import capture_airbnb_newyork_listing
+import capture_airbnb_paris_map
+import capture_airbnb_tokyo_experiences
+import capture_saucedemo_cart_management
+import capture_saucedemo_checkout
+import capture_saucedemo_inventory_filter
+
+from _runner import AG_GRID_READY, PagePool, run, shutdown
+
+AIRBNB_READY = "input[data-testid='structured-search-input-field-query']"
+
+# (script module, storage state name, goto wait_until, readiness selector)
+CAPTURES = [
+    (capture_ag_grid_audit_view, "ag_grid", "domcontentloaded", AG_GRID_READY),
+    (capture_ag_grid_audit_view_french, "ag_grid", "domcontentloaded", AG_GRID_READY),
+    (capture_ag_grid_audit_view_spanish, "ag_grid", "domcontentloaded", AG_GRID_READY),
+    (capture_ag_grid_chess_group, "ag_grid", "domcontentloaded", AG_GRID_READY),
+    (capture_ag_grid_chess_selection, "ag_grid", "domcontentloaded", AG_GRID_READY),
+    (capture_ag_grid_column_toggle, "ag_grid", "domcontentloaded", AG_GRID_READY),
+    (capture_ag_grid_filter, "ag_grid", "domcontentloaded", AG_GRID_READY),
+    (capture_ag_grid_pin_language, "ag_grid", "domcontentloaded", AG_GRID_READY),
+    (capture_ag_grid_quick_filter, "ag_grid", "domcontentloaded", AG_GRID_READY),
+    (capture_airbnb_newyork_listing, None, "commit", AIRBNB_READY),
+    (capture_airbnb_paris_map, None, "commit", AIRBNB_READY),
+    (capture_airbnb_tokyo_experiences, None, "commit", AIRBNB_READY),
+    (capture_saucedemo_cart_management, "saucedemo", "commit", "#user-name, .inventory_item"),
+    (capture_saucedemo_checkout, "saucedemo", "commit", "#user-name, .inventory_item"),
+    (capture_saucedemo_inventory_filter, "saucedemo", "commit", "#user-name, .inventory_item"),
+]
+
+
+async def run_all(concurrency: int = 4) -> int:
+    """Run every capture task; returns the number of failures."""
+    semaphore = asyncio.Semaphore(concurrency)
+    pools = {}
+
+    def pool_for(module, state_name, wait_until, ready_selector) -> PagePool:
+        key = (module.START_URL, wait_until, state_name)
+        if key not in pools:
+            pools[key] = PagePool(
+                module.START_URL,
+                size=concurrency,
+                wait_until=wait_until,
+                storage_state_name=state_name,
+                ready_selector=ready_selector
+            )
+        return pools[key]
+
+    async def bounded(module, state_name, wait_until, ready_selector):
+        async with semaphore:
+            pool = pool_for(module, state_name, wait_until, ready_selector)
+            async with pool.acquire() as page:
+                await module.main(page)
+
+    try:
+        results = await asyncio.gather(
+            *(bounded(*entry) for entry in CAPTURES),
+            return_exceptions=True
+        )
+    finally:
+        for pool in pools.values():
+            await pool.close()
+        await shutdown()
+
+    failures = 0
+    for (module, _, _, _), result in zip(CAPTURES, results):
+        if isinstance(result, Exception):
+            failures += 1
+            print(f"FAILED {module.TASK_ID}: {result}")
+        else:
+            print(f"ok     {module.TASK_ID}")
+    return failures
+
+
+if __name__ == "__main__":
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    sys.exit(1 if run(run_all(concurrency)) else 0)
@@ -1,34 +1,40 @@
 """Application adapters for different web apps."""
 
-from adapters.base_adapter import BaseAdapter
+from adapters.base_adapter import BaseAdapter, GenericAdapter
 from adapters.linear_adapter import LinearAdapter
-from adapters.notion_adapter import NotionAdapter
+from adapters.notion_adapter import NotionAdapter, NotionSessionPool
 
 __all__ = [
     'BaseAdapter',
+    'GenericAdapter',
     'LinearAdapter',
-    'NotionAdapter'
+    'NotionAdapter',
+    'NotionSessionPool',
+    'get_adapter',
+    'register_adapter'
 ]
 
+_REGISTRY = {
+    "linear": LinearAdapter,
+    "notion": NotionAdapter
+}
+
+
+def register_adapter(name: str, adapter_cls):
+    """Register an adapter class for an app name."""
+    _REGISTRY[name.lower()] = adapter_cls
+
 
 def get_adapter(app_name: str, app_config) -> BaseAdapter:
     """
     Get the appropriate adapter for an app.
-    
+
     Args:
         app_name: Name of the app
         app_config: Configuration for the app
-    
+
     Returns:
-        Adapter instance
+        Adapter instance (GenericAdapter for unknown apps)
     """
-    app_name = app_name.lower()
-    
-    if app_name == "linear":
-        return LinearAdapter(app_config)
-    elif app_name == "notion":
-        return NotionAdapter(app_config)
-    else:
-        # Return base adapter for unknown apps
-        return BaseAdapter(app_config)
+    return _REGISTRY.get(app_name.lower(), GenericAdapter)(app_config)
 
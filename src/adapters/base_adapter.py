@@ -1,10 +1,11 @@
 """Base adapter interface for web applications."""
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Dict, Any, Optional
 from playwright.async_api import Page
 
-from utils import log, AppConfig
+from utils import log, config, AppConfig
 
 
 class BaseAdapter(ABC):
@@ -43,6 +44,10 @@ class BaseAdapter(ABC):
         """
         pass
     
+    def storage_state_path(self) -> Path:
+        """Where this app's authenticated storage state is persisted."""
+        return config.root_dir / ".auth" / f"{self.app_config.name}.json"
+
     def get_initial_context(self) -> Dict[str, Any]:
         """
         Get initial context information about the app.
@@ -102,3 +107,23 @@ class BaseAdapter(ABC):
         """
         return {}
 
+
+class GenericAdapter(BaseAdapter):
+    """Concrete fallback for apps without a dedicated adapter.
+
+    Keeps the orchestrator usable for registry misses (e.g. apps.yaml
+    entries like asana): the base URL comes straight from the config and
+    authentication is left to saved storage state or the app being public.
+    """
+
+    def get_base_url(self) -> str:
+        """Get the configured base URL for the application."""
+        return self.app_config.base_url
+
+    async def setup_authentication(self, page: Page, credentials: Dict[str, str]) -> bool:
+        """No app-specific login flow; rely on saved storage state."""
+        log.warning(
+            f"No adapter registered for '{self.app_config.name}'; "
+            "skipping app-specific authentication"
+        )
+        return True
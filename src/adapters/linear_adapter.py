@@ -1,12 +1,65 @@
 """Adapter for Linear app (linear.app)."""
 
-import asyncio
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from playwright.async_api import Page
 
 from adapters.base_adapter import BaseAdapter
 from utils import log, AppConfig
 
+# Hint tables are shared read-only across callers, so they are frozen:
+# MappingProxyType plus tuple values means a cache hit allocates nothing
+# and accidental mutation raises instead of corrupting every later caller.
+_HINTS_CREATE_PROJECT = MappingProxyType({
+    "likely_elements": (
+        "button:has-text('New project')",
+        "button:has-text('Create project')",
+        "[aria-label='Create project']"
+    ),
+    "modal_selectors": (
+        "[role='dialog']",
+        ".modal",
+        "[data-radix-popper-content-wrapper]"
+    )
+})
+
+_HINTS_CREATE_ISSUE = MappingProxyType({
+    "likely_elements": (
+        "button:has-text('New issue')",
+        "button:has-text('Create issue')",
+        "[aria-label='Create issue']",
+        "button:has-text('C')"  # Keyboard shortcut button
+    ),
+    "form_fields": (
+        "input[placeholder*='Issue title']",
+        "textarea[placeholder*='Add description']"
+    )
+})
+
+_HINTS_FILTER = MappingProxyType({
+    "likely_elements": (
+        "button:has-text('Filter')",
+        "[aria-label='Filter']",
+        ".filter-button"
+    ),
+    "dropdown_selectors": (
+        "[role='menu']",
+        "[role='listbox']"
+    )
+})
+
+_HINTS_STATUS = MappingProxyType({
+    "likely_elements": (
+        "[data-status]",
+        ".status-button",
+        "button:has-text('Todo')",
+        "button:has-text('In Progress')",
+        "button:has-text('Done')"
+    )
+})
+
+_EMPTY_HINTS: Mapping[str, Any] = MappingProxyType({})
+
 
 class LinearAdapter(BaseAdapter):
     """Adapter for Linear project management tool."""
@@ -39,7 +92,7 @@ class LinearAdapter(BaseAdapter):
             
             # Navigate to login page
             await page.goto(self.app_config.login_url or "https://linear.app/login")
-            await asyncio.sleep(2)
+            await page.wait_for_load_state("domcontentloaded")
             
             # Check if already logged in
             if "linear.app/login" not in page.url:
@@ -63,9 +116,10 @@ class LinearAdapter(BaseAdapter):
             continue_button = await page.query_selector("button:has-text('Continue')")
             if continue_button:
                 await continue_button.click()
-                await asyncio.sleep(1)
-            
-            # Fill in password
+
+            # Fill in password; the selector wait below is the readiness
+            # signal for the screen the Continue click transitions to
+
             password_input = await page.wait_for_selector("input[type='password']", timeout=5000)
             await password_input.fill(password)
             
@@ -104,62 +158,17 @@ class LinearAdapter(BaseAdapter):
     def get_element_hints(self, task_query: str) -> Dict[str, Any]:
         """Get hints for Linear-specific tasks."""
         query_lower = task_query.lower()
-        
-        hints = {}
-        
-        if "create" in query_lower and "project" in query_lower:
-            hints = {
-                "likely_elements": [
-                    "button:has-text('New project')",
-                    "button:has-text('Create project')",
-                    "[aria-label='Create project']"
-                ],
-                "modal_selectors": [
-                    "[role='dialog']",
-                    ".modal",
-                    "[data-radix-popper-content-wrapper]"
-                ]
-            }
-        
-        elif "create" in query_lower and "issue" in query_lower:
-            hints = {
-                "likely_elements": [
-                    "button:has-text('New issue')",
-                    "button:has-text('Create issue')",
-                    "[aria-label='Create issue']",
-                    "button:has-text('C')"  # Keyboard shortcut button
-                ],
-                "form_fields": [
-                    "input[placeholder*='Issue title']",
-                    "textarea[placeholder*='Add description']"
-                ]
-            }
-        
-        elif "filter" in query_lower:
-            hints = {
-                "likely_elements": [
-                    "button:has-text('Filter')",
-                    "[aria-label='Filter']",
-                    ".filter-button"
-                ],
-                "dropdown_selectors": [
-                    "[role='menu']",
-                    "[role='listbox']"
-                ]
-            }
-        
-        elif "status" in query_lower:
-            hints = {
-                "likely_elements": [
-                    "[data-status]",
-                    ".status-button",
-                    "button:has-text('Todo')",
-                    "button:has-text('In Progress')",
-                    "button:has-text('Done')"
-                ]
-            }
-        
-        return hints
+
+        create = "create" in query_lower
+        if create and "project" in query_lower:
+            return _HINTS_CREATE_PROJECT
+        if create and "issue" in query_lower:
+            return _HINTS_CREATE_ISSUE
+        if "filter" in query_lower:
+            return _HINTS_FILTER
+        if "status" in query_lower:
+            return _HINTS_STATUS
+        return _EMPTY_HINTS
     
     async def pre_task_setup(self, page: Page) -> bool:
         """Setup before starting a Linear task."""
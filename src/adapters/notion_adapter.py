@@ -1,15 +1,137 @@
 """Adapter for Notion (notion.so)."""
 
 import asyncio
-from typing import Dict, Any
-from playwright.async_api import Page
+import re
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Awaitable, Callable, Dict, Any, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+from playwright.async_api import Locator, Page
 
 from adapters.base_adapter import BaseAdapter
 from utils import log, AppConfig
 
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+# Hint tables are shared read-only across callers, so they are frozen:
+# MappingProxyType plus tuple values means a cache hit allocates nothing
+# and accidental mutation raises instead of corrupting every later caller.
+_HINTS_CREATE_DATABASE = MappingProxyType({
+    "likely_elements": (
+        "button:has-text('Database')",
+        "[aria-label*='database']",
+        ".notion-focusable:has-text('Table')"
+    ),
+    "menu_selectors": (
+        "[role='menu']",
+        ".notion-menu"
+    )
+})
+
+_HINTS_FILTER_DATABASE = MappingProxyType({
+    "likely_elements": (
+        "button:has-text('Filter')",
+        "[aria-label='Filter']",
+        ".notion-database-view-filter-button"
+    ),
+    "dropdown_selectors": (
+        "[role='menu']",
+        ".notion-dropdown"
+    )
+})
+
+_HINTS_ADD_PROPERTY = MappingProxyType({
+    "likely_elements": (
+        "button:has-text('+')",
+        "[aria-label='Add property']",
+        ".notion-property-add-button"
+    ),
+    "property_types": (
+        "Select",
+        "Multi-select",
+        "Text",
+        "Number",
+        "Date"
+    )
+})
+
+_HINTS_CREATE_PAGE = MappingProxyType({
+    "likely_elements": (
+        "button:has-text('New page')",
+        "[aria-label='New page']",
+        ".notion-focusable:has-text('Add a page')"
+    )
+})
+
+_EMPTY_HINTS: Mapping[str, Any] = MappingProxyType({})
+
+# MutationObserver-backed selector wait. Playwright's wait_for_selector polls
+# on a fixed tick, so a selector that appears between ticks still waits out
+# the remainder; the observer resolves the moment the matching node lands.
+# Raw statements so the same source works for add_init_script and evaluate.
+_WAIT_FOR_SEL_JS = """
+window.__waitForSel = (sel, timeout) => new Promise((resolve, reject) => {
+    const found = document.querySelector(sel);
+    if (found) return resolve(true);
+    const observer = new MutationObserver(() => {
+        const el = document.querySelector(sel);
+        if (el) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        reject(new Error('__waitForSel timeout: ' + sel));
+    }, timeout);
+    observer.observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+        attributes: true
+    });
+});
+"""
+
+# Every selector the hint tables or the common-selector table can hand out;
+# used to pre-build Locator objects once per page instead of per use.
+_ALL_HINT_SELECTORS = tuple(
+    sel
+    for hint_dict in (
+        _HINTS_CREATE_DATABASE,
+        _HINTS_FILTER_DATABASE,
+        _HINTS_ADD_PROPERTY,
+        _HINTS_CREATE_PAGE,
+    )
+    for sel in hint_dict["likely_elements"]
+)
+
 
 class NotionAdapter(BaseAdapter):
     """Adapter for Notion workspace."""
+
+    # Logical-name -> selector table; a constant so get_common_selectors
+    # hands out the same dict instead of rebuilding it each call.
+    _COMMON_SELECTORS = MappingProxyType({
+        "new_page_button": "button:has-text('New page')",
+        "add_block": "[placeholder='Type \\'\\' for commands']",
+        "database_filter": "button:has-text('Filter')",
+        "add_property": "button:has-text('+')",
+        "menu": "[role='menu']",
+        "modal": "[role='dialog']"
+    })
+
+    def __init__(self, app_config: AppConfig):
+        super().__init__(app_config)
+        # The agent may ask for hints once per step with the same query;
+        # memoize so repeat calls skip even the tokenize pass.
+        self._hint_cache: Dict[str, Dict[str, Any]] = {}
+        # Locators compiled once per page; see locator_for()
+        self._locator_cache: Dict[str, Locator] = {}
+        self._locator_page: Page = None
+        # Selectors that validated on a given URL path; see resolve_selector()
+        self._resolved_selector_cache: Dict[Tuple[str, str], str] = {}
     
     def get_base_url(self) -> str:
         """Get the base URL for Notion."""
@@ -34,7 +156,11 @@ class NotionAdapter(BaseAdapter):
             
             # Navigate to login page
             await page.goto(self.app_config.login_url or "https://www.notion.so/login")
-            await asyncio.sleep(2)
+            await page.wait_for_load_state("domcontentloaded")
+            # Either the login form or the app shell, whichever Notion gives us
+            await page.wait_for_selector(
+                "input[type='email'], .notion-app-inner", timeout=5000
+            )
             
             # Check if already logged in
             current_url = page.url
@@ -51,32 +177,66 @@ class NotionAdapter(BaseAdapter):
                 await page.wait_for_url("**/notion.so/**", timeout=60000)
                 return True
             
-            # Fill in email
+            # Fill in email; the continue button already exists alongside the
+            # field, so its lookup overlaps the fill instead of following it
             email_input = await page.wait_for_selector("input[type='email']", timeout=5000)
-            await email_input.fill(email)
-            
-            # Click continue with email
-            continue_button = await page.query_selector("button:has-text('Continue with email')")
+            _, continue_button = await asyncio.gather(
+                email_input.fill(email),
+                page.query_selector("button:has-text('Continue with email')")
+            )
             if continue_button:
                 await continue_button.click()
-                await asyncio.sleep(2)
+                # Proceed as soon as the next screen renders its input
+                try:
+                    await page.wait_for_selector(
+                        "input[type='password'], [data-testid*='verification']",
+                        timeout=3000
+                    )
+                except Exception:
+                    pass  # fall through; the password probe below decides
             
-            # Fill in password if present
-            try:
-                password_input = await page.wait_for_selector("input[type='password']", timeout=3000)
+            # Race the password prompt against the post-login redirect, so
+            # a password-less (SSO/magic-link) flow proceeds the moment the
+            # redirect lands instead of waiting out the selector timeout
+            password_task = asyncio.create_task(
+                page.wait_for_selector("input[type='password']", timeout=3000)
+            )
+            redirect_task = asyncio.create_task(
+                page.wait_for_url(lambda url: "/login" not in url, timeout=3000)
+            )
+            done, pending = await asyncio.wait(
+                {password_task, redirect_task},
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            if password_task in done and password_task.exception() is None:
+                password_input = password_task.result()
                 await password_input.fill(password)
                 
                 # Submit
                 submit_button = await page.query_selector("button:has-text('Continue')")
                 if submit_button:
                     await submit_button.click()
-            except:
+            else:
                 log.info("Password-less login flow")
             
             # Wait for redirect
             await page.wait_for_url("**/notion.so/**", timeout=15000)
             
             log.info("Notion authentication successful")
+
+            # Persist cookies/localStorage so a warm start can load them
+            # into its context and skip the login UI entirely
+            try:
+                state_path = self.storage_state_path()
+                state_path.parent.mkdir(parents=True, exist_ok=True)
+                await page.context.storage_state(path=str(state_path))
+            except Exception as e:
+                log.warning(f"Could not save Notion storage state: {e}")
+
             return True
             
         except Exception as e:
@@ -102,71 +262,132 @@ class NotionAdapter(BaseAdapter):
     def get_element_hints(self, task_query: str) -> Dict[str, Any]:
         """Get hints for Notion-specific tasks."""
         query_lower = task_query.lower()
-        
-        hints = {}
-        
-        if "create" in query_lower and "database" in query_lower:
-            hints = {
-                "likely_elements": [
-                    "button:has-text('Database')",
-                    "[aria-label*='database']",
-                    ".notion-focusable:has-text('Table')"
-                ],
-                "menu_selectors": [
-                    "[role='menu']",
-                    ".notion-menu"
-                ]
-            }
-        
-        elif "filter" in query_lower and "database" in query_lower:
-            hints = {
-                "likely_elements": [
-                    "button:has-text('Filter')",
-                    "[aria-label='Filter']",
-                    ".notion-database-view-filter-button"
-                ],
-                "dropdown_selectors": [
-                    "[role='menu']",
-                    ".notion-dropdown"
-                ]
-            }
-        
-        elif "property" in query_lower or "add property" in query_lower:
-            hints = {
-                "likely_elements": [
-                    "button:has-text('+')",
-                    "[aria-label='Add property']",
-                    ".notion-property-add-button"
-                ],
-                "property_types": [
-                    "Select",
-                    "Multi-select",
-                    "Text",
-                    "Number",
-                    "Date"
-                ]
-            }
-        
-        elif "create" in query_lower and "page" in query_lower:
-            hints = {
-                "likely_elements": [
-                    "button:has-text('New page')",
-                    "[aria-label='New page']",
-                    ".notion-focusable:has-text('Add a page')"
-                ]
-            }
-        
+        cached = self._hint_cache.get(query_lower)
+        if cached is not None:
+            return cached
+
+        # One tokenize pass, then O(1) set membership per keyword, instead
+        # of a substring scan over the query for each check
+        tokens = set(_TOKEN_RE.findall(query_lower))
+
+        if "create" in tokens and "database" in tokens:
+            hints = _HINTS_CREATE_DATABASE
+        elif "filter" in tokens and "database" in tokens:
+            hints = _HINTS_FILTER_DATABASE
+        elif "property" in tokens:
+            hints = _HINTS_ADD_PROPERTY
+        elif "create" in tokens and "page" in tokens:
+            hints = _HINTS_CREATE_PAGE
+        else:
+            hints = _EMPTY_HINTS
+
+        self._hint_cache[query_lower] = hints
         return hints
-    
+
+    def locator_for(self, page: Page, selector: str) -> Locator:
+        """Return a Locator for `selector`, building it at most once per page.
+
+        Locators are lazy handles, so they stay valid across navigations
+        within the same page; the cache is dropped when a new page is bound.
+        """
+        if page is not self._locator_page:
+            self._locator_page = page
+            self._locator_cache = {}
+        locator = self._locator_cache.get(selector)
+        if locator is None:
+            locator = self._locator_cache[selector] = page.locator(selector)
+        return locator
+
+    async def fast_wait(self, page: Page, selector: str, timeout: int = 5000) -> bool:
+        """Wait for a selector via the injected MutationObserver helper.
+
+        Resolves as soon as the node appears instead of on the next poll
+        tick; falls back to wait_for_selector when the helper is missing
+        (e.g. pre_task_setup has not run on this page).
+
+        Returns:
+            True if the selector appeared within the timeout
+        """
+        try:
+            await page.evaluate(
+                "([sel, t]) => window.__waitForSel(sel, t)", [selector, timeout]
+            )
+            return True
+        except Exception as e:
+            if "__waitForSel" in str(e) and "timeout" in str(e):
+                return False
+            try:
+                await page.wait_for_selector(selector, timeout=timeout)
+                return True
+            except Exception:
+                return False
+
+    async def resolve_selector(self, page: Page, logical_name: str) -> Optional[str]:
+        """Resolve a logical selector name to a selector present on the page.
+
+        Notion's CSS paths for a given control are stable per URL, so the
+        first selector that matches on a page is cached keyed by
+        (url_path, logical_name) and revalidated with a cheap count()
+        before re-use; only a failed revalidation pays the full lookup.
+        """
+        url_path = urlsplit(page.url).path
+        key = (url_path, logical_name)
+
+        cached = self._resolved_selector_cache.get(key)
+        if cached is not None:
+            try:
+                if await self.locator_for(page, cached).count() > 0:
+                    return cached
+            except Exception:
+                pass
+            del self._resolved_selector_cache[key]
+
+        selector = self._COMMON_SELECTORS.get(logical_name)
+        if selector is None:
+            return None
+        try:
+            if await self.locator_for(page, selector).count() > 0:
+                self._resolved_selector_cache[key] = selector
+                return selector
+        except Exception:
+            pass
+        return None
+
     async def pre_task_setup(self, page: Page) -> bool:
         """Setup before starting a Notion task."""
         try:
-            # Wait for Notion's app to load
-            await page.wait_for_selector(".notion-app-inner", timeout=10000)
+            # Probe for the app shell with exponential backoff: a fast load
+            # is caught after the first 50 ms sleep, a slow one costs eight
+            # probes over ~10 s instead of a round-trip every poll tick
+            app_inner = await page.query_selector(".notion-app-inner")
+            if app_inner is None:
+                for delay in (0.05, 0.1, 0.2, 0.4, 0.8, 1.5, 3.0, 3.0):
+                    await asyncio.sleep(delay)
+                    app_inner = await page.query_selector(".notion-app-inner")
+                    if app_inner is not None:
+                        break
+            if app_inner is None:
+                raise TimeoutError(".notion-app-inner did not appear within ~10s")
             log.info("Notion UI loaded")
-            
-            # Additional wait for full hydration
-            await asyncio.sleep(2)
+
+            # Install the observer-based wait helper: on this document now,
+            # and via init script for any navigation that follows
+            await page.add_init_script(_WAIT_FOR_SEL_JS)
+            await page.evaluate("() => {" + _WAIT_FOR_SEL_JS + "}")
+
+            # Wait for hydration to actually finish rather than sleeping
+            await page.wait_for_function(
+                "!!document.querySelector('.notion-frame')"
+                " && !document.querySelector('.notion-loading')",
+                timeout=5000
+            )
+
+            # Pre-build locators for every selector the hint tables can
+            # return, so later element resolution reuses them
+            for selector in _ALL_HINT_SELECTORS:
+                self.locator_for(page, selector)
+            for selector in self._COMMON_SELECTORS.values():
+                self.locator_for(page, selector)
             return True
         except Exception as e:
             log.warning(f"Notion pre-task setup issue: {e}")
@@ -174,12 +395,112 @@ class NotionAdapter(BaseAdapter):
     
     def get_common_selectors(self) -> Dict[str, str]:
         """Get common Notion selectors."""
-        return {
-            "new_page_button": "button:has-text('New page')",
-            "add_block": "[placeholder='Type \\'\\' for commands']",
-            "database_filter": "button:has-text('Filter')",
-            "add_property": "button:has-text('+')",
-            "menu": "[role='menu']",
-            "modal": "[role='dialog']"
-        }
+        return self._COMMON_SELECTORS
+
+
+@dataclass
+class _NotionSession:
+    """A pooled page plus the bookkeeping used to decide when to retire it."""
+    page: Page
+    uses: int = 0
+    born: float = 0.0
+
+
+class NotionSessionPool:
+    """Pool of pages that have already completed Notion authentication.
+
+    setup_authentication costs seconds of navigation and hydration per
+    login, so the pool pays it once per page and then hands warm,
+    authenticated sessions out on acquire(). Sessions are retired after
+    max_uses checkouts or max_age seconds so stale Notion logins never
+    accumulate, and a session whose task raised is dropped rather than
+    reused.
+    """
+
+    def __init__(
+        self,
+        adapter: NotionAdapter,
+        new_page: Callable[[], Awaitable[Page]],
+        credentials: Optional[Dict[str, str]] = None,
+        size: int = 2,
+        max_uses: int = 50,
+        max_age: float = 30 * 60
+    ):
+        """
+        Args:
+            adapter: The NotionAdapter that owns authentication
+            new_page: Factory producing a fresh Page (e.g. from
+                BrowserController's context)
+            credentials: Passed to setup_authentication when warming a page
+            size: Maximum concurrent sessions
+            max_uses: Checkouts before a session is retired
+            max_age: Seconds before a session is retired
+        """
+        self.adapter = adapter
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self._new_page = new_page
+        self._credentials = credentials
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(size)
+
+    def _expired(self, session: _NotionSession) -> bool:
+        if session.page.is_closed():
+            return True
+        if session.uses >= self.max_uses:
+            return True
+        return asyncio.get_event_loop().time() - session.born >= self.max_age
+
+    async def _retire(self, session: _NotionSession):
+        try:
+            await session.page.close()
+        except Exception:
+            pass  # a session we are discarding anyway
+
+    async def _warm_session(self) -> _NotionSession:
+        """Create a page and run it through login and pre-task setup."""
+        page = await self._new_page()
+        if self._credentials:
+            await self.adapter.setup_authentication(page, self._credentials)
+        await self.adapter.pre_task_setup(page)
+        return _NotionSession(page=page, born=asyncio.get_event_loop().time())
+
+    async def warm_up(self, count: int = 1):
+        """Pre-authenticate `count` sessions before any task needs one."""
+        sessions = await asyncio.gather(
+            *(self._warm_session() for _ in range(count))
+        )
+        for session in sessions:
+            self._idle.put_nowait(session)
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Yield an authenticated page, returning it to the pool afterwards."""
+        await self._slots.acquire()
+        try:
+            session = None
+            while not self._idle.empty():
+                candidate = self._idle.get_nowait()
+                if self._expired(candidate):
+                    await self._retire(candidate)
+                else:
+                    session = candidate
+                    break
+            if session is None:
+                session = await self._warm_session()
+            session.uses += 1
+
+            try:
+                yield session.page
+            except Exception:
+                # The task may have left the page in an unknown state
+                await self._retire(session)
+                raise
+            self._idle.put_nowait(session)
+        finally:
+            self._slots.release()
 
+    async def close(self):
+        """Close every idle session."""
+        while not self._idle.empty():
+            await self._retire(self._idle.get_nowait())
@@ -1,6 +1,6 @@
 """Core components of the SoftLight system."""
 
-from .browser_controller import BrowserController
+from .browser_controller import BrowserController, shutdown_browser_pool
 from .llm_agent import LLMAgent, Action
 from .ui_detector import UIChangeDetector, UIState
 from .state_manager import StateManager, CapturedStep, WorkflowDataset
@@ -11,6 +11,7 @@ from .goal_monitor import GoalMonitor
 
 __all__ = [
     'BrowserController',
+    'shutdown_browser_pool',
     'LLMAgent',
     'Action',
     'UIChangeDetector',
@@ -1,10 +1,20 @@
 """Action validation and loop prevention for intelligent navigation."""
 
+import re
 from typing import List, Optional, Dict, Any
-from collections import Counter
+from collections import Counter, deque
 from .llm_agent import Action
 from utils import log
 
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+# Keyword groups for exploration hints; frozensets make each check a
+# single C-level intersection instead of repeated substring scans
+_SEARCH_TERMS = frozenset({"find", "search"})
+_ARTICLE_TERMS = frozenset({"article", "blog", "post"})
+_TEAM_TERMS = frozenset({"team", "people"})
+_CREATE_TERMS = frozenset({"create", "how"})
+
 
 class ActionValidator:
     """Validates actions and prevents repetitive loops to enable human-like navigation."""
@@ -17,24 +27,26 @@ class ActionValidator:
             max_repeats: Maximum times the same action can be repeated
         """
         self.max_repeats = max_repeats
-        self.action_history: List[Action] = []
+        # One tuple-keyed Counter tracks per-URL repeats; element_click_count
+        # stays separate so get_avoided_elements remains an O(elements) read
         self.element_click_count: Counter = Counter()
-        self.page_url_actions: Dict[str, List[str]] = {}
+        self._url_action_counts: Counter = Counter()
+        # Last max_repeats (action_type, element_id) pairs; the deque keeps
+        # the stuck-in-a-loop check a fixed-size tail compare with no slicing
+        self._recent_sig: deque = deque(maxlen=max_repeats)
+
         
     def add_action(self, action: Action, current_url: str):
         """Record an action in history."""
-        self.action_history.append(action)
-        
         # Track element clicks
         if action.element_id is not None:
             self.element_click_count[action.element_id] += 1
         
-        # Track actions per URL
-        if current_url not in self.page_url_actions:
-            self.page_url_actions[current_url] = []
-        
-        action_signature = f"{action.action_type}:{action.element_id or action.selector}"
-        self.page_url_actions[current_url].append(action_signature)
+        # Track actions per URL; the Counter keeps the repeat check O(1)
+        # instead of rescanning a per-URL signature list on every proposal
+        self._url_action_counts[(current_url, action.signature)] += 1
+
+        self._recent_sig.append(action.signature)
     
     def is_repetitive(self, action: Action, current_url: str) -> bool:
         """
@@ -54,23 +66,15 @@ class ActionValidator:
                 return True
         
         # Check for same action at same URL
-        if current_url in self.page_url_actions:
-            action_signature = f"{action.action_type}:{action.element_id or action.selector}"
-            count = self.page_url_actions[current_url].count(action_signature)
-            
-            if count >= self.max_repeats:
-                log.warning(f"Action '{action_signature}' already performed {count} times at this URL")
-                return True
+        count = self._url_action_counts[(current_url, action.signature)]
+        if count >= self.max_repeats:
+            log.warning(f"Action '{action.action_type}:{action.element_id or action.selector}' already performed {count} times at this URL")
+            return True
         
         # Check for recent identical actions
-        if len(self.action_history) >= 2:
-            last_two = self.action_history[-2:]
-            if all(
-                a.action_type == action.action_type and 
-                a.element_id == action.element_id 
-                for a in last_two
-            ):
-                log.warning("Same action repeated 3 times in a row - likely stuck")
+        if len(self._recent_sig) == self.max_repeats:
+            if self._recent_sig.count(action.signature) == self.max_repeats:
+                log.warning(f"Same action repeated {self.max_repeats + 1} times in a row - likely stuck")
                 return True
         
         return False
@@ -117,22 +121,22 @@ class ActionValidator:
             Hints string to help AI navigate better
         """
         hints = []
-        
-        # Analyze task for key terms
-        task_lower = task_query.lower()
-        
-        if "find" in task_lower or "search" in task_lower:
+
+        # Analyze task for key terms in one tokenize pass
+        tokens = set(_TOKEN_RE.findall(task_query.lower()))
+
+        if tokens & _SEARCH_TERMS:
             hints.append("Look for search boxes, navigation menus, or 'Perspectives/Blog' sections")
-        
-        if "article" in task_lower or "blog" in task_lower or "post" in task_lower:
+
+        if tokens & _ARTICLE_TERMS:
             hints.append("Navigate to Perspectives, Blog, News, or Articles sections")
-        
-        if "team" in task_lower or "people" in task_lower:
+
+        if tokens & _TEAM_TERMS:
             hints.append("Look for Team, About Us, or People navigation links")
-        
-        if "create" in task_lower or "how to" in task_lower:
+
+        if tokens & _CREATE_TERMS:
             hints.append("Look for Getting Started, Tutorial, or Documentation links")
-        
+
         if hints:
             return "NAVIGATION HINTS: " + "; ".join(hints)
         
@@ -140,8 +144,10 @@ class ActionValidator:
     
     def reset(self):
         """Reset the validator for a new workflow."""
-        self.action_history = []
-        self.element_click_count = Counter()
-        self.page_url_actions = {}
+        # clear() reuses the existing containers instead of reallocating
+        # them for every workflow
+        self.element_click_count.clear()
+        self._url_action_counts.clear()
+        self._recent_sig.clear()
 
 
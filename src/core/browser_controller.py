@@ -18,6 +18,280 @@ import io
 from utils import log, config, AppConfig
 
 
+# SoM (Set-of-Marks) helpers, installed once per context via
+# add_init_script so the browser parses and compiles them a single time;
+# each later call is a one-line evaluate instead of shipping ~3 KB of
+# source over CDP per action-loop iteration.
+_SOM_INIT_JS = """
+// Joined once at script install instead of per injection call
+window.__somSelector = [
+    'button',
+    'a[href]',
+    'input:not([type="hidden"])',
+    'textarea',
+    'select',
+    '[role="button"]',
+    '[role="link"]',
+    '[role="menuitem"]',
+    '[role="tab"]',
+    '[role="option"]',
+    '[contenteditable="true"]',
+    '[onclick]',
+    'label[for]',
+    '[tabindex]:not([tabindex="-1"])'
+].join(', ');
+
+window.__somInject = () => new Promise((resolve) => {
+    // Remove any existing labels
+    document.querySelectorAll('.som-label, .som-overlay').forEach(el => el.remove());
+
+    // In-page node cache: element-info lookups become an array index
+    // instead of a querySelector scan per call
+    window.__somNodes = [];
+
+    // Find all potentially interactive elements
+    const elements = Array.from(
+        document.querySelectorAll(window.__somSelector)
+    );
+    if (elements.length === 0) return resolve({ count: 0, elements: [] });
+
+    // One IntersectionObserver pass hands back visibility plus geometry
+    // for every candidate at once, instead of forcing a layout per
+    // element with getBoundingClientRect inside the loop
+    const observer = new IntersectionObserver((entries) => {
+        observer.disconnect();
+
+        const elementMap = [];
+        const fragment = document.createDocumentFragment();
+        let labelIndex = 0;
+
+        for (const entry of entries) {
+            if (!entry.isIntersecting) continue;
+
+            const el = entry.target;
+            const rect = entry.boundingClientRect;
+            if (rect.width <= 0 || rect.height <= 0) continue;
+
+            // Style is only consulted for candidates that passed the
+            // geometry filter
+            const style = window.getComputedStyle(el);
+            if (
+                style.visibility === 'hidden' ||
+                style.display === 'none' ||
+                style.opacity === '0'
+            ) continue;
+
+            // Store element reference
+            el.setAttribute('data-som-id', labelIndex);
+            window.__somNodes[labelIndex] = el;
+
+            // Create visual label overlay
+            const label = document.createElement('div');
+            label.className = 'som-label';
+            label.textContent = labelIndex;
+            label.style.cssText = `
+                position: fixed;
+                left: ${rect.left + window.scrollX}px;
+                top: ${rect.top + window.scrollY}px;
+                background: rgba(255, 0, 0, 0.9);
+                color: white;
+                padding: 2px 6px;
+                border-radius: 4px;
+                font-size: 11px;
+                font-weight: bold;
+                font-family: monospace;
+                z-index: 2147483647;
+                pointer-events: none;
+                box-shadow: 0 2px 4px rgba(0,0,0,0.3);
+                border: 1px solid rgba(255, 255, 255, 0.3);
+            `;
+
+            fragment.appendChild(label);
+
+            // Store element info for reference
+            elementMap.push({
+                id: labelIndex,
+                tagName: el.tagName.toLowerCase(),
+                text: el.innerText?.slice(0, 100) || el.value || el.placeholder || '',
+                type: el.type || '',
+                role: el.getAttribute('role') || '',
+                ariaLabel: el.getAttribute('aria-label') || '',
+                href: el.href || '',
+                x: Math.round(rect.left),
+                y: Math.round(rect.top),
+                width: Math.round(rect.width),
+                height: Math.round(rect.height)
+            });
+
+            labelIndex++;
+        }
+
+        // One append for all labels: a single layout pass instead of one
+        // per inserted overlay
+        document.body.appendChild(fragment);
+
+        resolve({
+            count: labelIndex,
+            elements: elementMap
+        });
+    });
+
+    elements.forEach(el => observer.observe(el));
+});
+
+window.__somRemove = () => {
+    document.querySelectorAll('.som-label, .som-overlay').forEach(el => el.remove());
+};
+
+window.__somElementInfo = (elementId) => {
+    const cached = window.__somNodes && window.__somNodes[elementId];
+    const el = (cached && cached.isConnected)
+        ? cached
+        : document.querySelector('[data-som-id="' + elementId + '"]');
+    if (!el) return null;
+
+    const rect = el.getBoundingClientRect();
+    return {
+        tagName: el.tagName.toLowerCase(),
+        text: el.innerText?.slice(0, 200) || el.value || '',
+        type: el.type || '',
+        placeholder: el.placeholder || '',
+        href: el.href || '',
+        disabled: el.disabled || false,
+        visible: rect.width > 0 && rect.height > 0
+    };
+};
+"""
+
+
+# Headless agent runs never use these Chromium subsystems; skipping them
+# trims process-spawn time and resident memory. Firefox/WebKit take no args.
+_CHROMIUM_LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--mute-audio",
+]
+
+
+class _BrowserPool:
+    """Process-wide Playwright driver and shared Browser instances.
+
+    Launching a browser costs seconds of process spawn and V8 init while a
+    BrowserContext is comparatively free, so controllers share one Browser
+    per (type, headless) combination and isolate themselves with contexts.
+    """
+
+    _playwright = None
+    _browsers: Dict[Tuple[str, bool], Browser] = {}
+    _contexts_open: Dict[Tuple[str, bool], int] = {}
+    _lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        # Created lazily so importing the module never binds an event loop
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    async def connect(cls, cdp_endpoint: str) -> Browser:
+        """Return a shared connection to an already-running Chromium.
+
+        Pointing many controllers at one externally managed Chromium
+        (launched with --remote-debugging-port) multiplexes them onto a
+        single set of renderer/network helper processes; the CDP WebSocket
+        is dialed once per endpoint and shared.
+        """
+        async with cls._get_lock():
+            if cls._playwright is None:
+                cls._playwright = await async_playwright().start()
+            key = ("cdp", cdp_endpoint)
+            browser = cls._browsers.get(key)
+            if browser is None or not browser.is_connected():
+                log.info(f"Connecting to Chromium over CDP: {cdp_endpoint}")
+                browser = await cls._playwright.chromium.connect_over_cdp(cdp_endpoint)
+                cls._browsers[key] = browser
+                cls._contexts_open[key] = 0
+            cls._contexts_open[key] += 1
+            return browser
+
+    @classmethod
+    async def get(cls, browser_type: str, headless: bool) -> Tuple[Browser, str]:
+        """Return a shared Browser for the given settings, launching on first use."""
+        async with cls._get_lock():
+            if cls._playwright is None:
+                cls._playwright = await async_playwright().start()
+
+            browser_type = browser_type.lower()
+            launchers = {
+                "chromium": cls._playwright.chromium,
+                "firefox": cls._playwright.firefox,
+                "webkit": cls._playwright.webkit,
+            }
+            if browser_type not in launchers:
+                log.warning(f"Unknown browser_type '{browser_type}', defaulting to Chromium")
+                browser_type = "chromium"
+
+            key = (browser_type, headless)
+            browser = cls._browsers.get(key)
+            if browser is None or not browser.is_connected():
+                launch_kwargs = {"headless": headless}
+                if browser_type == "chromium":
+                    launch_kwargs.update(
+                        args=_CHROMIUM_LAUNCH_ARGS,
+                        chromium_sandbox=False,
+                        handle_sigint=False,
+                    )
+                try:
+                    log.info(
+                        f"Launching shared browser: {browser_type} "
+                        f"(args={launch_kwargs.get('args', [])})"
+                    )
+                    browser = await launchers[browser_type].launch(**launch_kwargs)
+                except Exception as launch_error:
+                    log.error(f"Failed to launch {browser_type}: {launch_error}")
+                    if browser_type != "chromium":
+                        raise
+                    log.info("Attempting fallback to WebKit")
+                    browser_type = "webkit"
+                    key = (browser_type, headless)
+                    browser = await cls._playwright.webkit.launch(headless=headless)
+                cls._browsers[key] = browser
+                cls._contexts_open[key] = 0
+            cls._contexts_open[key] += 1
+            return browser, browser_type
+
+    @classmethod
+    async def release(cls, key: Tuple):
+        """Record that a controller's context closed; the browser stays warm."""
+        async with cls._get_lock():
+            if cls._contexts_open.get(key, 0) > 0:
+                cls._contexts_open[key] -= 1
+
+    @classmethod
+    async def shutdown(cls):
+        """Close every shared browser and stop Playwright. Call at process exit."""
+        async with cls._get_lock():
+            for browser in cls._browsers.values():
+                try:
+                    await browser.close()
+                except Exception:
+                    pass
+            cls._browsers.clear()
+            cls._contexts_open.clear()
+            if cls._playwright is not None:
+                await cls._playwright.stop()
+                cls._playwright = None
+
+
+async def shutdown_browser_pool():
+    """Close the shared browsers started by BrowserController instances."""
+    await _BrowserPool.shutdown()
+
+
 class BrowserController:
     """Manages browser automation using Playwright."""
     
@@ -25,7 +299,9 @@ class BrowserController:
         self,
         app_config: AppConfig,
         headless: bool = False,
-        browser_type: str = "chromium"
+        browser_type: str = "chromium",
+        storage_state_path: Optional[Path] = None,
+        cdp_endpoint: Optional[str] = None
     ):
         """
         Initialize the browser controller.
@@ -33,15 +309,33 @@ class BrowserController:
         Args:
             app_config: Configuration for the target app
             headless: Whether to run browser in headless mode
+            storage_state_path: Saved cookies/localStorage to load into new
+                contexts (e.g. an adapter's storage_state_path()); skipped
+                when the file does not exist yet
+            cdp_endpoint: Connect to an already-running Chromium over CDP
+                (e.g. "http://localhost:9222") instead of launching one;
+                headless/browser_type are ignored when set
         """
         self.app_config = app_config
         self.headless = headless
         self.browser_type = browser_type
-        self.playwright = None
+        self.storage_state_path = storage_state_path
+        self.cdp_endpoint = cdp_endpoint
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.action_timeout = getattr(app_config, "action_timeout", 7000)
+        # Element map from the last SoM injection, keyed by SoM id; backs
+        # the coordinate fast path in click_by_som_id
+        self._som_elements: Dict[int, Dict[str, Any]] = {}
+        # Page-read memoization keyed by a cheap DOM fingerprint; see
+        # _cached_read
+        self._read_cache: Dict[str, Any] = {}
+        self._dom_sig: Optional[str] = None
+        # Resource blocking for text/DOM-centric flows; empty by default
+        # because captured screenshots are usually the deliverable
+        self._blocked_types = set(getattr(app_config, "block_resource_types", []) or [])
+        self._blocking_enabled = bool(self._blocked_types)
         
     async def __aenter__(self):
         """Async context manager entry."""
@@ -53,73 +347,92 @@ class BrowserController:
         await self.close()
     
     async def start(self):
-        """Start the browser."""
+        """Start the controller on the shared browser."""
         log.info(f"Starting browser for {self.app_config.name}")
         
-        self.playwright = await async_playwright().start()
-        
-        # Launch browser with appropriate settings
-        self.browser, actual_type = await self._launch_browser(self.browser_type)
-        self.browser_type = actual_type
-    async def _launch_browser(self, browser_type: str) -> Tuple[Browser, str]:
-        """Launch the requested browser type, falling back if needed."""
-        browser_map = {
-            "chromium": self.playwright.chromium,
-            "firefox": self.playwright.firefox,
-            "webkit": self.playwright.webkit,
-        }
-        target = browser_map.get(browser_type.lower())
-        if not target:
-            log.warning(f"Unknown browser_type '{browser_type}', defaulting to Chromium")
-            target = self.playwright.chromium
-            browser_type = "chromium"
-        
-        try:
-            log.info(f"Launching Playwright browser: {browser_type}")
-            browser = await target.launch(headless=self.headless)
-            return browser, browser_type
-        except Exception as launch_error:
-            log.error(f"Failed to launch {browser_type}: {launch_error}")
-            if browser_type == "chromium":
-                log.info("Attempting fallback to WebKit")
-                browser = await self.playwright.webkit.launch(headless=self.headless)
-                return browser, "webkit"
-            raise
-        
+        if self.cdp_endpoint:
+            self.browser = await _BrowserPool.connect(self.cdp_endpoint)
+            self.browser_type = "chromium"
+            self._pool_key = ("cdp", self.cdp_endpoint)
+        else:
+            self.browser, self.browser_type = await _BrowserPool.get(
+                self.browser_type, self.headless
+            )
+            self._pool_key = (self.browser_type, self.headless)
         await self._create_context_and_page()
         
         log.info("Browser started successfully")
     
     async def close(self):
-        """Close the browser and cleanup."""
-        log.info("Closing browser")
+        """Close this controller's context; the shared browser stays warm."""
+        log.info("Closing browser context")
         
-        if self.page:
-            await self.page.close()
+        if self.context and self.storage_state_path:
+            # Refresh the saved state so the next run starts where this
+            # session's cookies/localStorage left off
+            try:
+                Path(self.storage_state_path).parent.mkdir(parents=True, exist_ok=True)
+                await self.context.storage_state(path=str(self.storage_state_path))
+            except Exception as e:
+                log.warning(f"Could not save storage state: {e}")
         if self.context:
-            await self.context.close()
+            try:
+                # Closing the context tears down its pages in the same CDP
+                # operation, so no separate page.close() round trip
+                await self.context.close()
+            except Exception as e:
+                log.warning(f"Context close failed: {e}")
+            self.context = None
+            self.page = None
         if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+            await _BrowserPool.release(self._pool_key)
+            self.browser = None
     
     async def _create_context_and_page(self):
         """Create a fresh browser context and page."""
         if not self.browser:
             return
+        context_kwargs = {}
+        if self.storage_state_path and Path(self.storage_state_path).exists():
+            # Start authenticated: setup_authentication sees the logged-in
+            # URL and short-circuits without walking the login UI
+            context_kwargs["storage_state"] = str(self.storage_state_path)
         self.context = await self.browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             locale='en-US',
-            timezone_id='America/New_York'
+            timezone_id='America/New_York',
+            **context_kwargs
         )
         self.context.set_default_timeout(self.app_config.page_load_timeout)
+        # Compile the SoM helpers once for every document this context loads
+        await self.context.add_init_script(_SOM_INIT_JS)
+        if self._blocked_types:
+            # One context-level route serves every page this context opens
+            await self.context.route("**/*", self._route_filter)
         self.page = await self.context.new_page()
     
-    async def _ensure_page(self):
-        """Ensure a valid page exists before interacting."""
-        if self.page and not self.page.is_closed():
-            return
+    async def _route_filter(self, route):
+        """Abort requests for blocked resource types when blocking is on."""
+        if self._blocking_enabled and route.request.resource_type in self._blocked_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def set_resource_blocking(self, enabled: bool):
+        """Toggle resource blocking, e.g. off before a visually-faithful shot."""
+        self._blocking_enabled = enabled and bool(self._blocked_types)
+
+    def _page_ok(self) -> bool:
+        """Steady-state guard: the current page exists and is open.
+
+        Synchronous so the per-method preamble costs an attribute check
+        instead of scheduling a coroutine on every call.
+        """
+        return self.page is not None and not self.page.is_closed()
+
+    async def _reopen_page(self):
+        """Recreate the page (and context if needed) after it was closed."""
         if not self.context:
             await self._create_context_and_page()
             return
@@ -128,7 +441,52 @@ class BrowserController:
         except Exception:
             await self._create_context_and_page()
     
-    async def navigate(self, url: str, wait_until: str = "networkidle") -> bool:
+    async def _await_network_quiet(self, max_ms: int = 800):
+        """Give in-flight requests a bounded chance to finish.
+
+        networkidle never fires on pages that poll, so it is only ever
+        awaited with a short cap; hitting the cap is normal, not an error.
+        """
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=max_ms)
+        except PlaywrightTimeoutError:
+            pass
+
+    # Cheap change signal for the read cache: element count, title, and URL
+    # move on any render worth re-reading for
+    _DOM_SIG_JS = (
+        "() => [document.querySelectorAll('*').length,"
+        " document.title, location.href].join('|')"
+    )
+
+    async def _cached_read(self, key: str, compute):
+        """Memoize an expensive page read behind the DOM fingerprint.
+
+        Agents re-request page text and accessibility snapshots between
+        actions even when nothing changed; one fingerprint evaluate decides
+        whether the cached value is still valid.
+        """
+        sig = await self.page.evaluate(self._DOM_SIG_JS)
+        if sig != self._dom_sig:
+            self._read_cache.clear()
+            self._dom_sig = sig
+        if key not in self._read_cache:
+            self._read_cache[key] = await compute()
+        return self._read_cache[key]
+
+    def _invalidate_reads(self):
+        """Drop cached page reads after an action that may mutate the DOM."""
+        self._dom_sig = None
+
+    async def _settle(self, cap_ms: int = 400):
+        """Post-action settle: wait for the network to go quiet, capped.
+
+        Replaces the fixed wait_after_action sleep; returns as soon as the
+        page is stable instead of always paying the full delay.
+        """
+        await self._await_network_quiet(cap_ms)
+
+    async def navigate(self, url: str, wait_until: str = "domcontentloaded") -> bool:
         """
         Navigate to a URL.
         
@@ -141,32 +499,89 @@ class BrowserController:
             True if navigation successful, False otherwise
         """
         try:
-            await self._ensure_page()
+            if not self._page_ok():
+                await self._reopen_page()
+            self._invalidate_reads()
             log.info(f"Navigating to: {url}")
             await self.page.goto(url, wait_until=wait_until)
-            await asyncio.sleep(self.app_config.wait_for_navigation)
+            # Bounded settle instead of a fixed post-navigation sleep; the
+            # SoM injection that follows is the real readiness signal
+            await self._await_network_quiet()
             return True
         except Exception as e:
             log.error(f"Navigation failed: {e}")
             return False
     
-    async def take_screenshot(self, output_path: Optional[Path] = None) -> Image.Image:
+    async def take_screenshot_bytes(self, format: str = "jpeg", quality: Optional[int] = None) -> bytes:
         """
-        Take a screenshot of the current page.
+        Raw encoded screenshot bytes straight from the browser.
         
         Args:
-            output_path: Optional path to save screenshot
+            format: "jpeg" or "png"
+            quality: JPEG quality; defaults to config.screenshot_quality
+        
+        Returns:
+            Encoded image bytes, with no Python-side decode or copy
+        """
+        if not self._page_ok():
+            await self._reopen_page()
+        kwargs: Dict[str, Any] = {"full_page": False, "type": format}
+        if format == "jpeg":
+            kwargs["quality"] = quality if quality is not None else config.screenshot_quality
+        return await self.page.screenshot(**kwargs)
+
+    async def take_screenshot_ndarray(self):
+        """
+        Screenshot as a BGR ndarray for vision/tensor consumers.
+        
+        Decodes with cv2.imdecode directly from the PNG bytes, skipping the
+        PIL Image plus tobytes() copies.
+        
+        Returns:
+            numpy.ndarray of shape (height, width, 3)
+        """
+        import cv2
+        import numpy as np
+        
+        raw = await self.take_screenshot_bytes(format="png")
+        return cv2.imdecode(np.frombuffer(raw, np.uint8), cv2.IMREAD_COLOR)
+
+    async def take_screenshot(self, output_path: Optional[Path] = None, *, decode: bool = True):
+        """
+        Take a screenshot of the current page.
         
+        Args:
+            output_path: Optional path to save screenshot; the browser
+                encodes and writes the file itself, with no PIL round-trip.
+                A .png suffix gets PNG bytes, anything else JPEG
+            decode: Return a PIL image. Pass False when only the bytes or
+                the on-disk file are needed, skipping the decode entirely
+
         Returns:
-            PIL Image object
+            PIL Image when decode is True, otherwise the raw screenshot bytes
         """
-        await self._ensure_page()
-        screenshot_bytes = await self.page.screenshot(full_page=False)
-        image = Image.open(io.BytesIO(screenshot_bytes))
+        if not self._page_ok():
+            await self._reopen_page()
+        if output_path is not None:
+            image_type = "png" if Path(output_path).suffix.lower() == ".png" else "jpeg"
+            kwargs: Dict[str, Any] = {
+                "full_page": False,
+                "path": str(output_path),
+                "type": image_type,
+            }
+            if image_type == "jpeg":
+                kwargs["quality"] = config.screenshot_quality
+            screenshot_bytes = await self.page.screenshot(**kwargs)
+        else:
+            screenshot_bytes = await self.take_screenshot_bytes(format="png")
         
-        if output_path:
-            image.save(output_path, quality=config.screenshot_quality)
+        if not decode:
+            return screenshot_bytes
         
+        # Context-managed buffer so the intermediate copy is freed promptly
+        with io.BytesIO(screenshot_bytes) as buffer:
+            image = Image.open(buffer)
+            image.load()
         return image
     
     async def wait_for_stability(self, timeout: float = 2.0):
@@ -188,7 +603,9 @@ class BrowserController:
             True if click successful, False otherwise
         """
         try:
-            await self._ensure_page()
+            if not self._page_ok():
+                await self._reopen_page()
+            self._invalidate_reads()
             if selector:
                 locator = self.page.locator(selector)
                 return await self._click_locator(locator, description or selector)
@@ -199,13 +616,26 @@ class BrowserController:
                 log.error("Must provide either selector or coordinates")
                 return False
             
-            await asyncio.sleep(self.app_config.wait_after_action)
+            await self._settle()
             return True
             
         except Exception as e:
             log.error(f"Click failed: {e}")
             return False
     
+    async def _keyboard_input(self, text: str):
+        """Keyboard fallback for typing into a focused element.
+
+        With fast_typing, insert_text delivers the whole string in one
+        Input.insertText call instead of a per-character round-trip with a
+        50 ms delay; the slow path stays available for sites that validate
+        on individual key events.
+        """
+        if self.app_config.fast_typing:
+            await self.page.keyboard.insert_text(text)
+        else:
+            await self.page.keyboard.type(text, delay=50)
+
     async def type_text(self, selector: str, text: str, description: str = "") -> bool:
         """
         Type text into an input field.
@@ -219,7 +649,9 @@ class BrowserController:
             True if typing successful, False otherwise
         """
         try:
-            await self._ensure_page()
+            if not self._page_ok():
+                await self._reopen_page()
+            self._invalidate_reads()
             log.info(f"Typing into: {description or selector}")
             locator = self.page.locator(selector)
             if not await self._prepare_locator(locator, description or selector):
@@ -236,12 +668,12 @@ class BrowserController:
                     log.warning(f"Fallback fill failed, trying keyboard typing: {second_error}")
                     try:
                         await locator.focus()
-                        await self.page.keyboard.type(text, delay=50)
+                        await self._keyboard_input(text)
                     except Exception as final_error:
                         log.error(f"Typing failed: {final_error}")
                         return False
             
-            await asyncio.sleep(self.app_config.wait_after_action)
+            await self._settle()
             return True
         except Exception as e:
             log.error(f"Typing failed: {e}")
@@ -258,10 +690,12 @@ class BrowserController:
             True if successful, False otherwise
         """
         try:
-            await self._ensure_page()
+            if not self._page_ok():
+                await self._reopen_page()
+            self._invalidate_reads()
             log.info(f"Pressing key: {key}")
             await self.page.keyboard.press(key)
-            await asyncio.sleep(self.app_config.wait_after_action)
+            await self._settle()
             return True
         except Exception as e:
             log.error(f"Key press failed: {e}")
@@ -279,10 +713,12 @@ class BrowserController:
             True if successful, False otherwise
         """
         try:
-            await self._ensure_page()
+            if not self._page_ok():
+                await self._reopen_page()
+            self._invalidate_reads()
             log.info(f"Hovering over: {description or selector}")
             await self.page.hover(selector)
-            await asyncio.sleep(self.app_config.wait_after_action)
+            await self._settle()
             return True
         except Exception as e:
             log.error(f"Hover failed: {e}")
@@ -300,13 +736,15 @@ class BrowserController:
             True if successful, False otherwise
         """
         try:
-            await self._ensure_page()
+            if not self._page_ok():
+                await self._reopen_page()
+            self._invalidate_reads()
             log.info(f"Scrolling {direction} by {amount}px")
             if direction == "down":
                 await self.page.mouse.wheel(0, amount)
             else:
                 await self.page.mouse.wheel(0, -amount)
-            await asyncio.sleep(self.app_config.wait_after_action)
+            await self._settle()
             return True
         except Exception as e:
             log.error(f"Scroll failed: {e}")
@@ -319,12 +757,17 @@ class BrowserController:
         Returns:
             Dictionary with page information
         """
-        await self._ensure_page()
-        return {
-            "url": self.page.url,
-            "title": await self.page.title(),
-            "viewport": self.page.viewport_size
-        }
+        if not self._page_ok():
+            await self._reopen_page()
+
+        async def compute():
+            return {
+                "url": self.page.url,
+                "title": await self.page.title(),
+                "viewport": self.page.viewport_size
+            }
+
+        return await self._cached_read("page_info", compute)
 
     async def get_page_text(self) -> str:
         """
@@ -334,7 +777,10 @@ class BrowserController:
             The textual content of the <body> element.
         """
         try:
-            return await self.page.inner_text("body", timeout=2000)
+            async def compute():
+                return await self.page.inner_text("body", timeout=2000)
+
+            return await self._cached_read("page_text", compute)
         except Exception as e:
             log.warning(f"Failed to get page text: {e}")
             return ""
@@ -351,7 +797,8 @@ class BrowserController:
             True if element appeared, False otherwise
         """
         try:
-            await self._ensure_page()
+            if not self._page_ok():
+                await self._reopen_page()
             await self.page.wait_for_selector(selector, timeout=timeout)
             return True
         except Exception as e:
@@ -369,16 +816,23 @@ class BrowserController:
             Dictionary with element information or None if not found
         """
         try:
-            await self._ensure_page()
+            if not self._page_ok():
+                await self._reopen_page()
             element = await self.page.query_selector(selector)
             if not element:
                 return None
             
-            box = await element.bounding_box()
+            # Independent reads: dispatch together so the call costs one
+            # round-trip latency instead of three in sequence
+            box, text, visible = await asyncio.gather(
+                element.bounding_box(),
+                element.text_content(),
+                element.is_visible()
+            )
             return {
                 "selector": selector,
-                "text": await element.text_content(),
-                "visible": await element.is_visible(),
+                "text": text,
+                "visible": visible,
                 "bounding_box": box
             }
         except Exception as e:
@@ -397,23 +851,33 @@ class BrowserController:
             List of element information dictionaries
         """
         try:
-            await self._ensure_page()
-            # Use XPath to find elements containing text
-            xpath = f"//{tag}[contains(text(), '{text}')]"
-            elements = await self.page.query_selector_all(f"xpath={xpath}")
-            
-            results = []
-            for element in elements:
-                if await element.is_visible():
-                    box = await element.bounding_box()
-                    if box:
-                        results.append({
-                            "text": await element.text_content(),
-                            "tag": await element.evaluate("el => el.tagName"),
-                            "bounding_box": box
-                        })
-            
-            return results
+            if not self._page_ok():
+                await self._reopen_page()
+            # One evaluate walks, filters, and measures the matches in-page;
+            # the old XPath version paid four driver round-trips per match.
+            # Arguments are passed structurally, so the text needs no escaping.
+            return await self.page.evaluate(
+                """({ text, tag }) => {
+                    const results = [];
+                    document.querySelectorAll(tag).forEach(el => {
+                        if (!el.textContent || !el.textContent.includes(text)) return;
+                        const box = el.getBoundingClientRect();
+                        if (box.width <= 0 || box.height <= 0) return;
+                        results.push({
+                            text: el.textContent.slice(0, 200),
+                            tag: el.tagName,
+                            bounding_box: {
+                                x: box.x,
+                                y: box.y,
+                                width: box.width,
+                                height: box.height
+                            }
+                        });
+                    });
+                    return results;
+                }""",
+                {"text": text, "tag": tag}
+            )
         except Exception as e:
             log.warning(f"Failed to find elements by text: {e}")
             return []
@@ -427,9 +891,13 @@ class BrowserController:
             Accessibility tree data or None if failed
         """
         try:
-            await self._ensure_page()
-            snapshot = await self.page.accessibility.snapshot()
-            return snapshot
+            if not self._page_ok():
+                await self._reopen_page()
+
+            async def compute():
+                return await self.page.accessibility.snapshot()
+
+            return await self._cached_read("accessibility_tree", compute)
         except Exception as e:
             log.warning(f"Failed to get accessibility tree: {e}")
             return None
@@ -445,12 +913,20 @@ class BrowserController:
             Result of script execution
         """
         try:
-            await self._ensure_page()
+            if not self._page_ok():
+                await self._reopen_page()
+            self._invalidate_reads()
             return await self.page.evaluate(script)
         except Exception as e:
             log.error(f"Script execution failed: {e}")
             return None
     
+    async def _ensure_som_helpers(self):
+        """Install the SoM helpers on documents that predate the init script."""
+        installed = await self.page.evaluate("() => !!window.__somInject")
+        if not installed:
+            await self.page.evaluate("() => {" + _SOM_INIT_JS + "}")
+
     async def inject_som_labels(self) -> Dict[str, Any]:
         """
         Inject Set-of-Marks labels on all interactive elements.
@@ -459,122 +935,27 @@ class BrowserController:
         Returns:
             Dictionary with element count and mapping
         """
-        label_script = """
-        () => {
-            // Remove any existing labels
-            document.querySelectorAll('.som-label, .som-overlay').forEach(el => el.remove());
-            
-            // Find all potentially interactive elements
-            const interactiveSelectors = [
-                'button',
-                'a[href]',
-                'input:not([type="hidden"])',
-                'textarea',
-                'select',
-                '[role="button"]',
-                '[role="link"]',
-                '[role="menuitem"]',
-                '[role="tab"]',
-                '[role="option"]',
-                '[contenteditable="true"]',
-                '[onclick]',
-                'label[for]',
-                '[tabindex]:not([tabindex="-1"])'
-            ];
-            
-            const elements = document.querySelectorAll(interactiveSelectors.join(', '));
-            const elementMap = [];
-            let labelIndex = 0;
-            
-            elements.forEach((el) => {
-                // Only label visible and interactable elements
-                const rect = el.getBoundingClientRect();
-                const style = window.getComputedStyle(el);
-                
-                const isVisible = (
-                    rect.width > 0 &&
-                    rect.height > 0 &&
-                    style.visibility !== 'hidden' &&
-                    style.display !== 'none' &&
-                    style.opacity !== '0' &&
-                    rect.top < window.innerHeight &&
-                    rect.bottom > 0 &&
-                    rect.left < window.innerWidth &&
-                    rect.right > 0
-                );
-                
-                if (!isVisible) return;
-                
-                // Store element reference
-                el.setAttribute('data-som-id', labelIndex);
-                
-                // Create visual label overlay
-                const label = document.createElement('div');
-                label.className = 'som-label';
-                label.textContent = labelIndex;
-                label.style.cssText = `
-                    position: fixed;
-                    left: ${rect.left + window.scrollX}px;
-                    top: ${rect.top + window.scrollY}px;
-                    background: rgba(255, 0, 0, 0.9);
-                    color: white;
-                    padding: 2px 6px;
-                    border-radius: 4px;
-                    font-size: 11px;
-                    font-weight: bold;
-                    font-family: monospace;
-                    z-index: 2147483647;
-                    pointer-events: none;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.3);
-                    border: 1px solid rgba(255, 255, 255, 0.3);
-                `;
-                
-                document.body.appendChild(label);
-                
-                // Store element info for reference
-                elementMap.push({
-                    id: labelIndex,
-                    tagName: el.tagName.toLowerCase(),
-                    text: el.innerText?.slice(0, 100) || el.value || el.placeholder || '',
-                    type: el.type || '',
-                    role: el.getAttribute('role') || '',
-                    ariaLabel: el.getAttribute('aria-label') || '',
-                    href: el.href || '',
-                    x: Math.round(rect.left),
-                    y: Math.round(rect.top),
-                    width: Math.round(rect.width),
-                    height: Math.round(rect.height)
-                });
-                
-                labelIndex++;
-            });
-            
-            return {
-                count: labelIndex,
-                elements: elementMap
-            };
-        }
-        """
-        
         try:
-            await self._ensure_page()
-            result = await self.page.evaluate(label_script)
+            if not self._page_ok():
+                await self._reopen_page()
+            await self._ensure_som_helpers()
+            result = await self.page.evaluate("() => window.__somInject()")
+            self._som_elements = {e["id"]: e for e in result["elements"]}
             log.info(f"✓ Injected SoM labels on {result['count']} interactive elements")
             return result
         except Exception as e:
             log.error(f"Failed to inject SoM labels: {e}")
+            self._som_elements = {}
             return {"count": 0, "elements": []}
     
     async def remove_som_labels(self):
         """Remove all Set-of-Marks labels from the page."""
-        remove_script = """
-        () => {
-            document.querySelectorAll('.som-label, .som-overlay').forEach(el => el.remove());
-        }
-        """
         try:
-            await self._ensure_page()
-            await self.page.evaluate(remove_script)
+            if not self._page_ok():
+                await self._reopen_page()
+            await self._ensure_som_helpers()
+            await self.page.evaluate("() => window.__somRemove()")
+            self._som_elements = {}
             log.debug("Removed SoM labels")
         except Exception as e:
             log.warning(f"Failed to remove SoM labels: {e}")
@@ -587,8 +968,31 @@ class BrowserController:
         """Return a locator for a Set-of-Marks element."""
         return self.page.locator(self._som_selector(element_id)).first
     
-    async def _prepare_locator(self, locator: Locator, description: str = "") -> bool:
-        """Ensure a locator is visible and ready for interaction."""
+    async def _prepare_locator(self, locator: Locator, description: str = "", *, som_id: int = None) -> bool:
+        """Ensure a locator is visible and ready for interaction.
+
+        When the caller passes the element's SoM id and the geometry cached
+        at injection time shows it fully in-viewport, a short visibility
+        wait is all that runs -- the scroll and hover round trips are
+        skipped. Stale geometry falls through to the full path.
+        """
+        if som_id is not None:
+            info = self._som_elements.get(som_id)
+            viewport = self.page.viewport_size if self.page else None
+            if info and viewport:
+                in_viewport = (
+                    info["y"] >= 0
+                    and info["y"] + info["height"] <= viewport["height"]
+                    and info["x"] >= 0
+                    and info["x"] + info["width"] <= viewport["width"]
+                )
+                if in_viewport:
+                    try:
+                        await locator.wait_for(state="visible", timeout=200)
+                        return True
+                    except Exception:
+                        pass  # re-check the slow way below
+
         try:
             await locator.wait_for(state="visible", timeout=self.action_timeout)
         except PlaywrightTimeoutError as e:
@@ -628,22 +1032,22 @@ class BrowserController:
             y = box["y"] + box["height"] / 2
             log.info(f"Fallback clicking via mouse at ({x}, {y}) for {description}")
             await self.page.mouse.click(x, y)
-            await asyncio.sleep(self.app_config.wait_after_action)
+            await self._settle()
             return True
         except Exception as e:
             log.error(f"Fallback mouse click failed for {description}: {e}")
             return False
     
-    async def _click_locator(self, locator: Locator, description: str = "") -> bool:
+    async def _click_locator(self, locator: Locator, description: str = "", *, som_id: int = None) -> bool:
         """Attempt to click a locator with retries and fallbacks."""
-        if not await self._prepare_locator(locator, description):
+        if not await self._prepare_locator(locator, description, som_id=som_id):
             return False
         
         for attempt in range(2):
             force = attempt == 1
             try:
                 await locator.click(timeout=self.action_timeout, force=force)
-                await asyncio.sleep(self.app_config.wait_after_action)
+                await self._settle()
                 return True
             except PlaywrightTimeoutError as e:
                 log.warning(f"Click timed out ({description}) attempt {attempt + 1}: {e}")
@@ -653,7 +1057,7 @@ class BrowserController:
         # Final fallback using mouse coordinates
         return await self._click_via_mouse(locator, description)
     
-    async def click_by_som_id(self, element_id: int, description: str = "") -> bool:
+    async def click_by_som_id(self, element_id: int, description: str = "", fast: bool = False) -> bool:
         """
         Click an element by its Set-of-Marks ID.
         This is more reliable than selector-based clicking.
@@ -661,15 +1065,31 @@ class BrowserController:
         Args:
             element_id: The SoM ID of the element
             description: Human-readable description
+            fast: Click the coordinates recorded at injection time directly,
+                skipping locator resolution and actionability checks; only
+                safe when the page has not scrolled or reflowed since
         
         Returns:
             True if successful, False otherwise
         """
         try:
-            await self._ensure_page()
+            if not self._page_ok():
+                await self._reopen_page()
+            self._invalidate_reads()
             log.info(f"Clicking SoM element #{element_id}: {description}")
+            if fast:
+                info = self._som_elements.get(element_id)
+                if info:
+                    x = info["x"] + info["width"] / 2
+                    y = info["y"] + info["height"] / 2
+                    await self.page.mouse.click(x, y)
+                    await self._settle()
+                    return True
+                # No cached geometry; fall through to the locator path
             locator = self._som_locator(element_id)
-            return await self._click_locator(locator, description or f"SoM #{element_id}")
+            return await self._click_locator(
+                locator, description or f"SoM #{element_id}", som_id=element_id
+            )
         except Exception as e:
             log.error(f"Failed to click SoM element #{element_id}: {e}")
             return False
@@ -687,10 +1107,14 @@ class BrowserController:
             True if successful, False otherwise
         """
         try:
-            await self._ensure_page()
+            if not self._page_ok():
+                await self._reopen_page()
+            self._invalidate_reads()
             log.info(f"Typing into SoM element #{element_id}: {description}")
             locator = self._som_locator(element_id)
-            if not await self._prepare_locator(locator, description or f"SoM #{element_id}"):
+            if not await self._prepare_locator(
+                locator, description or f"SoM #{element_id}", som_id=element_id
+            ):
                 return False
             
             try:
@@ -704,12 +1128,12 @@ class BrowserController:
                     log.warning(f"SoM fill retry failed, attempting keyboard input: {second_error}")
                     try:
                         await locator.focus()
-                        await self.page.keyboard.type(text, delay=50)
+                        await self._keyboard_input(text)
                     except Exception as final_error:
                         log.error(f"Failed typing into SoM element #{element_id}: {final_error}")
                         return False
             
-            await asyncio.sleep(self.app_config.wait_after_action)
+            await self._settle()
             return True
         except Exception as e:
             log.error(f"Failed to type into SoM element #{element_id}: {e}")
@@ -725,27 +1149,13 @@ class BrowserController:
         Returns:
             Element information or None if not found
         """
-        await self._ensure_page()
-        script = f"""
-        () => {{
-            const el = document.querySelector('[data-som-id="{element_id}"]');
-            if (!el) return null;
-            
-            const rect = el.getBoundingClientRect();
-            return {{
-                tagName: el.tagName.toLowerCase(),
-                text: el.innerText?.slice(0, 200) || el.value || '',
-                type: el.type || '',
-                placeholder: el.placeholder || '',
-                href: el.href || '',
-                disabled: el.disabled || false,
-                visible: rect.width > 0 && rect.height > 0
-            }};
-        }}
-        """
-        
         try:
-            return await self.page.evaluate(script)
+            if not self._page_ok():
+                await self._reopen_page()
+            await self._ensure_som_helpers()
+            return await self.page.evaluate(
+                "(id) => window.__somElementInfo(id)", element_id
+            )
         except Exception as e:
             log.warning(f"Failed to get SoM element info: {e}")
             return None
@@ -3,12 +3,24 @@
 from __future__ import annotations
 
 import re
+import string
 from typing import Dict, List, Tuple
 
 from core.navigation_planner import NavigationPlanner
 from utils import log
 
-STOPWORDS = {
+# Compiled once; the re module's internal cache still hashes the pattern
+# string on every call, and these run per token / per evaluate
+_WS_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+
+# translate + split beats a regex findall on the short ASCII task queries;
+# the regex stays as the fallback for non-ASCII input, where the character
+# class and the punctuation table diverge
+_TOKEN_TRANS = str.maketrans({c: " " for c in string.punctuation})
+
+# frozenset: these only ever answer membership tests
+STOPWORDS = frozenset({
     "how",
     "what",
     "when",
@@ -36,7 +48,7 @@ STOPWORDS = {
     "find",
     "view",
     "see",
-}
+})
 
 ROLE_KEYWORDS = [
     "director",
@@ -53,6 +65,20 @@ ROLE_KEYWORDS = [
     "architect",
 ]
 
+# One C-level scan per token instead of a Python any() loop over the
+# keyword lists; "comp" also covers "compensation" in the token check
+_ROLE_RE = re.compile("|".join(map(re.escape, ROLE_KEYWORDS)))
+# O(1) fast path for tokens that are exactly a role keyword; the regex
+# stays as the fallback for inflected forms like "directors"
+ROLE_KEYWORDS_SET = frozenset(ROLE_KEYWORDS)
+_SALARY_RE = re.compile(r"salary|comp")
+_SALARY_QUERY_RE = re.compile(r"salary|compensation")
+
+# Every query-level trigger in one findall instead of a substring scan
+# per keyword over the same string
+_TRIGGER_RE = re.compile(r"salary|compensation|pay|income|total comp|managing director")
+_CURRENCY_TRIGGERS = frozenset({"salary", "compensation", "pay", "income", "total comp"})
+
 SALARY_SYNONYMS = [
     "salary",
     "compensation",
@@ -65,6 +91,35 @@ SALARY_SYNONYMS = [
 ]
 
 
+def _has_currency(text: str) -> bool:
+    """True if the text contains a dollar sign followed by a digit.
+
+    str.find's memchr-backed scan makes the common no-'$' case one pass
+    over the text with no regex machinery or match-object allocation.
+    """
+    length = len(text)
+    i = text.find("$")
+    while i != -1:
+        j = i + 1
+        while j < length and text[j].isspace():
+            j += 1
+        if j < length and "0" <= text[j] <= "9":
+            return True
+        i = text.find("$", i + 1)
+    return False
+
+
+def _phrase_hit(hits: set, phrase_set: frozenset, term_set: frozenset) -> bool:
+    """Whether the scanned hit set satisfies a phrase/term group.
+
+    Phrase and term sets are subsets of all_terms, so the single scan's
+    hit set answers this without rescanning the page text.
+    """
+    if phrase_set:
+        return not hits.isdisjoint(phrase_set)
+    return not term_set or not hits.isdisjoint(term_set)
+
+
 class GoalMonitor:
     """Tracks goal completion and manages dynamic step extensions."""
 
@@ -75,6 +130,10 @@ class GoalMonitor:
         max_extensions: int = 4,
     ):
         self.task_query = task_query
+        # Lowercase once; __init__ and _build_terms previously re-lowered
+        # the query four or five times
+        self._query_lower = task_query.lower()
+        self._triggers = set(_TRIGGER_RE.findall(self._query_lower))
         self.intent = NavigationPlanner.extract_task_intent(task_query)
         (
             self.company_terms,
@@ -85,29 +144,52 @@ class GoalMonitor:
         self.company_phrases = [t for t in self.company_terms if " " in t]
         self.role_phrases = [t for t in self.role_terms if " " in t]
 
-        self.require_currency = any(
-            keyword in self.task_query.lower()
-            for keyword in ["salary", "compensation", "pay", "income", "total comp"]
-        )
+        self.require_currency = not self._triggers.isdisjoint(_CURRENCY_TRIGGERS)
 
-        self.all_terms = list(
+        self.all_terms = tuple(
             dict.fromkeys(self.company_terms + self.role_terms + self.context_terms)
         )
         self.required_hits = max(2, round(len(self.all_terms) * 0.45)) if self.all_terms else 0
 
+        # One alternation pattern finds every term in a single pass over the
+        # page text instead of one substring scan per term; the lookahead
+        # keeps terms that overlap a longer match countable, and sorting by
+        # length makes phrases win over their own words at the same position
+        terms = sorted((t for t in self.all_terms if t), key=len, reverse=True)
+        self._terms_re = (
+            re.compile("(?=(" + "|".join(map(re.escape, terms)) + "))")
+            if terms else None
+        )
+        self._company_phrase_set = frozenset(self.company_phrases)
+        self._company_term_set = frozenset(self.company_terms)
+        self._role_phrase_set = frozenset(self.role_phrases)
+        self._role_term_set = frozenset(self.role_terms)
+
         self.extension_chunk = extension_chunk
         self.max_extensions = max_extensions
         self.extensions_used = 0
 
         self.completed = False
         self.matched_terms: List[str] = []
+        # Set twin of matched_terms; get_prompt_hint runs every step and a
+        # list "not in" would make its comprehension quadratic
+        self._matched_set: frozenset = frozenset()
+
+        # The loop frequently re-evaluates identical page text while the UI
+        # settles; remembering the last text's hash skips the whole scan.
+        # evaluate is idempotent for the same text, so replaying the cached
+        # result leaves monitor state untouched.
+        self._last_text_hash: int = 0
+        self._last_result: Dict[str, object] = {}
         self.best_ratio = 0.0
 
     def _normalize(self, term: str) -> str:
-        return re.sub(r"\s+", " ", term.strip().lower())
+        return _WS_RE.sub(" ", term.strip().lower())
 
     def _tokenize(self, text: str) -> List[str]:
-        return re.findall(r"[A-Za-z0-9]+", text)
+        if text.isascii():
+            return text.translate(_TOKEN_TRANS).split()
+        return _TOKEN_RE.findall(text)
 
     def _build_terms(self) -> Tuple[List[str], List[str], List[str]]:
         company_terms: List[str] = []
@@ -128,43 +210,36 @@ class GoalMonitor:
             if normalized not in STOPWORDS:
                 context_terms.append(normalized)
 
-        # Tokenize query for additional hints
-        tokens = self._tokenize(self.task_query)
-        skip_tokens = set()
-
-        # Capture multi-word role phrases like "Managing Director"
-        joined = self.task_query.lower()
-        for key in ROLE_KEYWORDS:
-            if key in joined:
-                pass  # detection still handled below
+        # Tokenize query for additional hints; tokens come out of the
+        # already-lowercased query, so no per-token lower() is needed
+        tokens = self._tokenize(self._query_lower)
 
-        for token in tokens:
-            token_lower = token.lower()
+        for token_lower in tokens:
             if len(token_lower) <= 3 or token_lower in STOPWORDS:
                 continue
 
-            if any(key in token_lower for key in ROLE_KEYWORDS):
+            if token_lower in ROLE_KEYWORDS_SET or _ROLE_RE.search(token_lower):
                 role_terms.append(token_lower)
-            elif "salary" in token_lower or "comp" in token_lower:
+            elif _SALARY_RE.search(token_lower):
                 context_terms.append("salary")
             else:
                 context_terms.append(token_lower)
 
         # Add salary synonyms if the query mentions salary/compensation
-        if "salary" in self.task_query.lower() or "compensation" in self.task_query.lower():
+        if _SALARY_QUERY_RE.search(self._query_lower):
             context_terms.extend(SALARY_SYNONYMS)
 
         # Ensure critical phrases remain
-        if "managing director" in self.task_query.lower():
+        if "managing director" in self._triggers:
             role_terms.append("managing director")
             role_terms.append("managingdirector")
             # Avoid counting individual words when phrase is present
             role_terms = [term for term in role_terms if term not in {"managing", "director"}]
 
         return (
-            [t for t in dict.fromkeys(company_terms)],
-            [t for t in dict.fromkeys(role_terms)],
-            [t for t in dict.fromkeys(context_terms)],
+            list(dict.fromkeys(company_terms)),
+            list(dict.fromkeys(role_terms)),
+            list(dict.fromkeys(context_terms)),
         )
 
     def evaluate(self, page_text: str) -> Dict[str, object]:
@@ -178,25 +253,33 @@ class GoalMonitor:
                 "role_hit": False,
             }
 
+        text_hash = hash(page_text)
+        if text_hash == self._last_text_hash and self._last_result:
+            return self._last_result
+
         lower_text = page_text.lower()
-        matches = [term for term in self.all_terms if term and term in lower_text]
-        unique_matches = sorted(set(matches))
+        hits = set(self._terms_re.findall(lower_text)) if self._terms_re else set()
+        if hits:
+            # The alternation reports the longest term at each position, so
+            # a term shadowed by a longer match it prefixes is recovered here
+            for term in self.all_terms:
+                if term and term not in hits and any(h.startswith(term) for h in hits):
+                    hits.add(term)
+        # all_terms is already deduped, so filtering it against the hit set
+        # yields unique matches in term order without an O(N log N) sort;
+        # consumers only slice and join the list
+        unique_matches = [t for t in self.all_terms if t in hits]
 
         total_terms = len(self.all_terms) or 1
         ratio = len(unique_matches) / total_terms
         self.best_ratio = max(self.best_ratio, ratio)
 
-        def _phrase_hit(phrases: List[str], fallback_terms: List[str]) -> bool:
-            if phrases:
-                return any(phrase in lower_text for phrase in phrases)
-            return not fallback_terms or any(term in lower_text for term in fallback_terms)
-
-        company_hit = _phrase_hit(self.company_phrases, self.company_terms)
-        role_hit = _phrase_hit(self.role_phrases, self.role_terms)
+        company_hit = _phrase_hit(hits, self._company_phrase_set, self._company_term_set)
+        role_hit = _phrase_hit(hits, self._role_phrase_set, self._role_term_set)
 
         currency_hit = True
         if self.require_currency:
-            currency_hit = bool(re.search(r"\$[\s]*[0-9]", lower_text)) or "usd" in lower_text
+            currency_hit = _has_currency(lower_text) or "usd" in lower_text
 
         hit_threshold = self.required_hits or max(2, min(4, len(self.all_terms)))
         goal_met = (
@@ -208,8 +291,9 @@ class GoalMonitor:
 
         self.completed = goal_met
         self.matched_terms = unique_matches
+        self._matched_set = frozenset(hits)
 
-        return {
+        result: Dict[str, object] = {
             "done": goal_met,
             "matches": unique_matches,
             "ratio": ratio,
@@ -218,6 +302,9 @@ class GoalMonitor:
             "currency_hit": currency_hit,
             "min_hits": hit_threshold,
         }
+        self._last_text_hash = text_hash
+        self._last_result = result
+        return result
 
     def request_extension(self) -> int:
         """Request more steps if goal not achieved."""
@@ -234,7 +321,7 @@ class GoalMonitor:
         if self.completed:
             return "Goal conditions satisfied - respond with action_type 'done' if the final screenshot already shows the answer."
 
-        remaining = [term for term in self.all_terms if term not in self.matched_terms]
+        remaining = [term for term in self.all_terms if term not in self._matched_set]
         if not remaining:
             return ""
 
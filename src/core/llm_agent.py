@@ -1,6 +1,7 @@
 """LLM agent with vision capabilities for UI understanding and action decision."""
 
 import json
+import re
 from typing import Dict, Any, Optional, List, Literal
 from pathlib import Path
 from PIL import Image
@@ -13,13 +14,173 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 from utils import log, config, ImageProcessor
 
+# orjson's C parser is several times faster on the structured payloads the
+# models return; the stdlib is a drop-in fallback when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+# Pulls the payload out of a markdown code fence so the brace scan walks
+# the fenced block instead of the whole response
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# One client per provider for the whole process: each AsyncOpenAI /
+# AsyncAnthropic owns an HTTPX connection pool, so per-agent clients pay
+# a fresh TLS handshake on their first call instead of reusing keep-alive
+# connections. Creation is synchronous, so the lazy check needs no lock
+# under the single asyncio loop these agents run in.
+_openai_client: Optional[AsyncOpenAI] = None
+_anthropic_client: Optional[AsyncAnthropic] = None
+
+
+def _get_openai_client() -> AsyncOpenAI:
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(api_key=config.openai_api_key)
+    return _openai_client
+
+
+def _get_anthropic_client() -> AsyncAnthropic:
+    global _anthropic_client
+    if _anthropic_client is None:
+        _anthropic_client = AsyncAnthropic(api_key=config.anthropic_api_key)
+    return _anthropic_client
+
 
 ActionType = Literal["click", "type", "press_key", "hover", "scroll", "wait", "done", "navigate"]
 
 
+# The bulk of both analysis prompts never changes between calls; keeping
+# the static tails as module constants means each call only formats the
+# short dynamic header (mission, URL, history, elements) instead of
+# re-rendering ~3KB of fixed instructions through an f-string.
+_SOM_PROMPT_TAIL = """🧠 THINK LIKE A HUMAN:
+1. **Understand the goal**: What are you trying to find/accomplish?
+2. **Scan the page**: What navigation options do you see?
+3. **Choose intelligently**: Which element gets you closer to the goal?
+4. **Don't repeat**: If you've clicked something twice, try something else!
+5. **Look for key sections**: Menus, navigation bars, search boxes, "Perspectives/Blog" links
+
+🎯 NAVIGATION STRATEGY:
+- If looking for articles/blog posts → Find "Perspectives", "Blog", "News", or "Articles" link
+- If looking for people/team → Find "Team", "About", or "People" link
+- If looking for products → Find "Products", "Solutions", or "Portfolio" link
+- If stuck on homepage → Try the menu/hamburger icon or main navigation
+- If you keep seeing the same elements → You might be in a loop, try a DIFFERENT element!
+
+⚠️ AVOID LOOPS:
+- DON'T click the same element more than twice
+- If you just clicked element #5, try a DIFFERENT element
+- Look for new/unexplored navigation options
+- Humans don't click the same button 10 times!
+
+💭 THINK STEP-BY-STEP:
+1. "What am I looking for?" (e.g., blog posts, team page, tutorial)
+2. "What elements help me get there?" (navigation menus, search, specific links)
+3. "Have I tried this before?" (avoid repetition)
+4. "Am I making progress?" (new pages = good, same state = try something else)
+
+RESPONSE FORMAT (JSON):
+{
+    "action_type": "click" | "type" | "press_key" | "scroll" | "done",
+    "element_id": <NUMBER>,  // ← THE RED LABEL NUMBER
+    "description": "Brief action description",
+    "reasoning": "Why this advances the task AND why this element (not others)",
+    "text": "text to type (only if action_type is 'type')"
+}
+
+EXAMPLES:
+
+1. Click a button (using element ID):
+{
+    "action_type": "click",
+    "element_id": 12,
+    "description": "Click 'Create Project' button",
+    "reasoning": "Opens project creation modal"
+}
+
+2. Fill input field:
+{
+    "action_type": "type",
+    "element_id": 5,
+    "text": "My New Project",
+    "description": "Enter project name",
+    "reasoning": "Providing the required project name"
+}
+
+3. Task complete:
+{
+    "action_type": "done",
+    "description": "Task completed",
+    "reasoning": "Project created and visible in list"
+}
+
+Now analyze the screenshot with RED LABELS and return JSON with the next action:"""
+
+
+_FALLBACK_PROMPT_TAIL = """Your task is to analyze the screenshot and determine the NEXT action to accomplish the goal.
+
+IMPORTANT GUIDELINES:
+1. Think step-by-step about what needs to be done to complete the task
+2. Focus on UI elements that are relevant to the task
+3. If you see a button, menu, or modal that should be captured for the tutorial, interact with it
+4. Prefer clicking visible buttons/links over trying to guess selectors
+5. If a modal or dropdown appears, that's a new UI state worth capturing
+6. Be specific about what you're clicking and why
+7. If the task appears complete, return action_type "done"
+
+RESPONSE FORMAT:
+You MUST respond with valid JSON in this exact format:
+{
+    "action_type": "click" | "type" | "press_key" | "hover" | "scroll" | "wait" | "done",
+    "description": "Brief description of what this action does",
+    "reasoning": "Why this action helps accomplish the task",
+    "selector": "CSS selector for the element (if applicable)",
+    "text": "text to type (if action_type is 'type')",
+    "key": "key to press (if action_type is 'press_key', e.g., 'Enter', 'Escape')",
+    "direction": "up or down (if action_type is 'scroll')"
+}
+
+Example responses:
+1. Click button:
+{
+    "action_type": "click",
+    "description": "Click the 'Create Project' button",
+    "reasoning": "This opens the project creation modal which is needed for the tutorial",
+    "selector": "button:has-text('Create Project')"
+}
+
+2. Fill form:
+{
+    "action_type": "type",
+    "description": "Enter project name",
+    "reasoning": "Need to provide a name for the new project",
+    "selector": "input[placeholder='Project name']",
+    "text": "Tutorial Project"
+}
+
+3. Task complete:
+{
+    "action_type": "done",
+    "description": "Task completed successfully",
+    "reasoning": "The project has been created and is now visible in the list"
+}
+
+Now analyze the screenshot and provide the next action as JSON:"""
+
+
 class Action:
     """Represents an action to be performed in the browser."""
-    
+
+    # Slots keep instances compact and attribute access cheap; the agent
+    # allocates one Action per step and the validator reads them hot.
+    __slots__ = (
+        "action_type", "description", "selector", "coordinates", "text",
+        "key", "direction", "reasoning", "element_id", "signature"
+    )
+
     def __init__(
         self,
         action_type: ActionType,
@@ -41,6 +202,11 @@ class Action:
         self.direction = direction
         self.reasoning = reasoning
         self.element_id = element_id  # Set-of-Marks ID (preferred)
+        # Precomputed repeat-detection key; ActionValidator hashes this on
+        # every proposal, so it is built once here instead of per check
+        self.signature = (
+            action_type, element_id if element_id is not None else selector
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert action to dictionary."""
@@ -76,22 +242,67 @@ class LLMAgent:
         self.provider = provider.lower()
         
         if self.provider == "openai":
-            self.client = AsyncOpenAI(api_key=config.openai_api_key)
+            self.client = _get_openai_client()
             self.model = model or "gpt-4o"  # Updated to use gpt-4o which has vision
         elif self.provider == "anthropic":
-            self.client = AsyncAnthropic(api_key=config.anthropic_api_key)
+            self.client = _get_anthropic_client()
             self.model = model or "claude-3-5-sonnet-20241022"  # Updated to latest
         else:
             raise ValueError(f"Unsupported provider: {provider}")
         
         self.conversation_history: List[Dict[str, Any]] = []
         self.image_processor = ImageProcessor()
+        # analyze_ui and describe_ui_state are often called with the same
+        # screenshot; a tiny identity-keyed cache skips the repeat encode.
+        # The image itself is kept in the entry so its id cannot be reused
+        # by a new object while the cached encoding is alive.
+        self._encode_cache: Dict[int, tuple] = {}
+        # One buffer reused across encodes; screenshots are megabytes, so
+        # a fresh BytesIO per call is constant allocator churn
+        self._encode_buf = io.BytesIO()
+        # Rendered lines of the previous-actions summary; only new actions
+        # are formatted on each prompt build instead of the whole history
+        self._actions_lines: List[str] = []
     
+    # The vision models accept lossy input, and JPEG encodes several times
+    # faster than PNG while shrinking the base64 payload ~5-10x
+    _IMAGE_MEDIA_TYPE = "image/jpeg"
+
+    _ENCODE_CACHE_SIZE = 4
+    # The vision endpoints downsample anything larger server-side anyway,
+    # so pixels beyond this only cost local encode time and upload bytes
+    _MAX_IMAGE_DIM = 2048
+
     def _encode_image(self, image: Image.Image) -> str:
-        """Encode PIL Image to base64."""
-        buffered = io.BytesIO()
-        image.save(buffered, format="PNG")
-        return base64.b64encode(buffered.getvalue()).decode('utf-8')
+        """Encode PIL Image to base64 JPEG."""
+        key = id(image)
+        entry = self._encode_cache.get(key)
+        if entry is not None and entry[0] is image:
+            return entry[1]
+
+        source = image
+        width, height = source.size
+        largest = max(width, height)
+        if largest > self._MAX_IMAGE_DIM:
+            scale = self._MAX_IMAGE_DIM / largest
+            source = source.resize(
+                (max(1, round(width * scale)), max(1, round(height * scale))),
+                Image.Resampling.LANCZOS
+            )
+        if source.mode not in ("RGB", "L"):
+            source = source.convert("RGB")
+        buffered = self._encode_buf
+        buffered.seek(0)
+        buffered.truncate()
+        source.save(buffered, format="JPEG", quality=85, optimize=False)
+        # getbuffer() hands b64encode a view of the BytesIO contents
+        # instead of copying the encoded bytes out first
+        encoded = base64.b64encode(buffered.getbuffer()).decode('ascii')
+
+        if len(self._encode_cache) >= self._ENCODE_CACHE_SIZE:
+            self._encode_cache.pop(next(iter(self._encode_cache)))
+        self._encode_cache[key] = (image, encoded)
+        return encoded
     
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def analyze_ui(
@@ -147,27 +358,33 @@ class LLMAgent:
     ) -> str:
         """Build the prompt for UI analysis."""
         
-        actions_summary = "\n".join([
-            f"{i+1}. {action.action_type}: {action.description}"
-            for i, action in enumerate(previous_actions)
-        ])
+        # The history only grows within a session, so previously formatted
+        # lines are reused and just the new tail is rendered; a shrunken
+        # list means a new session, which drops the cache
+        lines = self._actions_lines
+        if len(lines) > len(previous_actions):
+            lines.clear()
+        for i in range(len(lines), len(previous_actions)):
+            action = previous_actions[i]
+            lines.append(f"{i+1}. {action.action_type}: {action.description}")
+        actions_summary = "\n".join(lines)
         
         # Build element map if using Set-of-Marks
         som_mode = som_elements is not None and len(som_elements) > 0
         element_info = ""
         
         if som_mode:
-            # Create a concise summary of labeled elements
-            key_elements = []
-            for el in som_elements[:50]:  # Limit to first 50 to avoid token overload
-                desc = el.get('text', '')[:50] or el.get('ariaLabel', '')[:50] or f"{el.get('tagName', 'element')}"
-                key_elements.append(f"  #{el['id']}: {el.get('tagName', 'element')} - {desc}")
-            
-            element_info = f"\n\nLabeled Interactive Elements (Red numbers on screenshot):\n" + "\n".join(key_elements)
+            # Concise summary of labeled elements, limited to the first 50
+            # to avoid token overload; one comprehension straight into join
+            element_info = "\n\nLabeled Interactive Elements (Red numbers on screenshot):\n" + "\n".join(
+                f"  #{el['id']}: {el.get('tagName', 'element')} - "
+                f"{(el.get('text') or el.get('ariaLabel') or el.get('tagName') or 'element')[:50]}"
+                for el in som_elements[:50]
+            )
         
         if som_mode:
             # Set-of-Marks mode: AI identifies numbered elements
-            prompt = f"""You are an INTELLIGENT AUTONOMOUS WEB AGENT that navigates like a HUMAN.
+            header = f"""You are an INTELLIGENT AUTONOMOUS WEB AGENT that navigates like a HUMAN.
 
 🎯 YOUR MISSION: {task_query}
 
@@ -182,72 +399,11 @@ class LLMAgent:
 🏷️ INTERACTIVE ELEMENTS (Red numbered labels on screenshot):
 {element_info}
 
-🧠 THINK LIKE A HUMAN:
-1. **Understand the goal**: What are you trying to find/accomplish?
-2. **Scan the page**: What navigation options do you see?
-3. **Choose intelligently**: Which element gets you closer to the goal?
-4. **Don't repeat**: If you've clicked something twice, try something else!
-5. **Look for key sections**: Menus, navigation bars, search boxes, "Perspectives/Blog" links
+"""
+            return header + _SOM_PROMPT_TAIL
 
-🎯 NAVIGATION STRATEGY:
-- If looking for articles/blog posts → Find "Perspectives", "Blog", "News", or "Articles" link
-- If looking for people/team → Find "Team", "About", or "People" link  
-- If looking for products → Find "Products", "Solutions", or "Portfolio" link
-- If stuck on homepage → Try the menu/hamburger icon or main navigation
-- If you keep seeing the same elements → You might be in a loop, try a DIFFERENT element!
-
-⚠️ AVOID LOOPS:
-- DON'T click the same element more than twice
-- If you just clicked element #5, try a DIFFERENT element
-- Look for new/unexplored navigation options
-- Humans don't click the same button 10 times!
-
-💭 THINK STEP-BY-STEP:
-1. "What am I looking for?" (e.g., blog posts, team page, tutorial)
-2. "What elements help me get there?" (navigation menus, search, specific links)
-3. "Have I tried this before?" (avoid repetition)
-4. "Am I making progress?" (new pages = good, same state = try something else)
-
-RESPONSE FORMAT (JSON):
-{{
-    "action_type": "click" | "type" | "press_key" | "scroll" | "done",
-    "element_id": <NUMBER>,  // ← THE RED LABEL NUMBER
-    "description": "Brief action description",
-    "reasoning": "Why this advances the task AND why this element (not others)",
-    "text": "text to type (only if action_type is 'type')"
-}}
-
-EXAMPLES:
-
-1. Click a button (using element ID):
-{{
-    "action_type": "click",
-    "element_id": 12,
-    "description": "Click 'Create Project' button",
-    "reasoning": "Opens project creation modal"
-}}
-
-2. Fill input field:
-{{
-    "action_type": "type",
-    "element_id": 5,
-    "text": "My New Project",
-    "description": "Enter project name",
-    "reasoning": "Providing the required project name"
-}}
-
-3. Task complete:
-{{
-    "action_type": "done",
-    "description": "Task completed",
-    "reasoning": "Project created and visible in list"
-}}
-
-Now analyze the screenshot with RED LABELS and return JSON with the next action:"""
-        
-        else:
-            # Fallback mode: AI generates selectors (less reliable)
-            prompt = f"""You are an AI agent helping to create a visual tutorial for: "{task_query}"
+        # Fallback mode: AI generates selectors (less reliable)
+        header = f"""You are an AI agent helping to create a visual tutorial for: "{task_query}"
 
 Current Page Information:
 - URL: {page_info.get('url', 'Unknown')}
@@ -258,57 +414,8 @@ Current Page Information:
 Previous Actions Taken:
 {actions_summary if actions_summary else 'None yet - this is the first step'}
 
-Your task is to analyze the screenshot and determine the NEXT action to accomplish the goal.
-
-IMPORTANT GUIDELINES:
-1. Think step-by-step about what needs to be done to complete the task
-2. Focus on UI elements that are relevant to the task
-3. If you see a button, menu, or modal that should be captured for the tutorial, interact with it
-4. Prefer clicking visible buttons/links over trying to guess selectors
-5. If a modal or dropdown appears, that's a new UI state worth capturing
-6. Be specific about what you're clicking and why
-7. If the task appears complete, return action_type "done"
-
-RESPONSE FORMAT:
-You MUST respond with valid JSON in this exact format:
-{{
-    "action_type": "click" | "type" | "press_key" | "hover" | "scroll" | "wait" | "done",
-    "description": "Brief description of what this action does",
-    "reasoning": "Why this action helps accomplish the task",
-    "selector": "CSS selector for the element (if applicable)",
-    "text": "text to type (if action_type is 'type')",
-    "key": "key to press (if action_type is 'press_key', e.g., 'Enter', 'Escape')",
-    "direction": "up or down (if action_type is 'scroll')"
-}}
-
-Example responses:
-1. Click button:
-{{
-    "action_type": "click",
-    "description": "Click the 'Create Project' button",
-    "reasoning": "This opens the project creation modal which is needed for the tutorial",
-    "selector": "button:has-text('Create Project')"
-}}
-
-2. Fill form:
-{{
-    "action_type": "type",
-    "description": "Enter project name",
-    "reasoning": "Need to provide a name for the new project",
-    "selector": "input[placeholder='Project name']",
-    "text": "Tutorial Project"
-}}
-
-3. Task complete:
-{{
-    "action_type": "done",
-    "description": "Task completed successfully",
-    "reasoning": "The project has been created and is now visible in the list"
-}}
-
-Now analyze the screenshot and provide the next action as JSON:"""
-        
-        return prompt
+"""
+        return header + _FALLBACK_PROMPT_TAIL
     
     async def _analyze_with_openai(self, screenshot: Image.Image, prompt: str) -> Action:
         """Analyze UI using OpenAI GPT-4 Vision."""
@@ -327,7 +434,7 @@ Now analyze the screenshot and provide the next action as JSON:"""
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/png;base64,{base64_image}",
+                            "url": f"data:{self._IMAGE_MEDIA_TYPE};base64,{base64_image}",
                             "detail": "high"
                         }
                     }
@@ -364,7 +471,7 @@ Now analyze the screenshot and provide the next action as JSON:"""
                             "type": "image",
                             "source": {
                                 "type": "base64",
-                                "media_type": "image/png",
+                                "media_type": self._IMAGE_MEDIA_TYPE,
                                 "data": base64_image
                             }
                         },
@@ -385,14 +492,17 @@ Now analyze the screenshot and provide the next action as JSON:"""
         """Parse LLM response into an Action object."""
         try:
             # Extract JSON from response (handle markdown code blocks)
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
-            
+            fence = _JSON_FENCE_RE.search(response_text)
+            candidate = fence.group(1) if fence else response_text
+
+            json_start = candidate.find('{')
+            json_end = candidate.rfind('}') + 1
+
             if json_start == -1 or json_end == 0:
                 raise ValueError("No JSON found in response")
-            
-            json_str = response_text[json_start:json_end]
-            data = json.loads(json_str)
+
+            json_str = candidate[json_start:json_end]
+            data = _json_loads(json_str)
             
             # Create Action object (supports both SoM and selector modes)
             return Action(
@@ -455,7 +565,7 @@ Provide a concise 1-2 sentence description suitable for a tutorial step."""
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/png;base64,{base64_image}"
+                                "url": f"data:{self._IMAGE_MEDIA_TYPE};base64,{base64_image}"
                             }
                         }
                     ]
@@ -484,7 +594,7 @@ Provide a concise 1-2 sentence description suitable for a tutorial step."""
                                 "type": "image",
                                 "source": {
                                     "type": "base64",
-                                    "media_type": "image/png",
+                                    "media_type": self._IMAGE_MEDIA_TYPE,
                                     "data": base64_image
                                 }
                             },
@@ -499,4 +609,5 @@ Provide a concise 1-2 sentence description suitable for a tutorial step."""
     def clear_history(self):
         """Clear conversation history."""
         self.conversation_history = []
+        self._actions_lines.clear()
 
@@ -5,6 +5,7 @@ from typing import Optional, Dict, Any, List
 from pathlib import Path
 from PIL import Image
 
+from adapters import get_adapter
 from core.browser_controller import BrowserController
 from core.llm_agent import LLMAgent, Action
 from core.ui_detector import UIChangeDetector
@@ -64,10 +65,15 @@ class WorkflowOrchestrator:
     async def start(self):
         """Start the orchestrator and browser."""
         log.info("Starting workflow orchestrator")
+        # Hand the controller the adapter's saved auth state so warm starts
+        # open the app already signed in instead of replaying the login UI;
+        # the controller also refreshes the state file on close.
+        adapter = get_adapter(self.app_config.name, self.app_config)
         self.browser = BrowserController(
             app_config=self.app_config,
             headless=self.headless,
-            browser_type=self.browser_type
+            browser_type=self.browser_type,
+            storage_state_path=adapter.storage_state_path()
         )
         await self.browser.start()
     
@@ -8,7 +8,7 @@ from datetime import datetime
 from PIL import Image
 from dataclasses import dataclass, asdict
 
-from utils import log, config, ImageProcessor
+from utils import log, config, ImageProcessor, LazyScreenshot
 
 
 @dataclass
@@ -65,35 +65,42 @@ class WorkflowDataset:
 class StateManager:
     """Manages capture and storage of UI states."""
     
-    def __init__(self, base_path: Optional[Path] = None):
+    def __init__(self, base_path: Optional[Path] = None, flush_every: int = 0):
         """
         Initialize the state manager.
-        
+
         Args:
             base_path: Base directory for dataset storage
+            flush_every: Write metadata to disk every N captured steps;
+                0 buffers everything until end_workflow. Screenshots are
+                always written immediately either way.
         """
         self.base_path = base_path or config.dataset_dir
         self.image_processor = ImageProcessor()
-        
+        self.flush_every = flush_every
+
         self.current_workflow: Optional[str] = None
         self.current_path: Optional[Path] = None
         self.captured_steps: List[CapturedStep] = []
         self.start_time: Optional[datetime] = None
+        self._metadata: Dict[str, Any] = {}
         
     def start_workflow(
         self,
         app_name: str,
         task_id: str,
-        task_query: str
+        task_query: str,
+        start_url: Optional[str] = None
     ) -> Path:
         """
         Start a new workflow capture session.
-        
+
         Args:
             app_name: Name of the application
             task_id: Unique task identifier
             task_query: The task being performed
-        
+            start_url: Starting URL recorded in the workflow metadata
+
         Returns:
             Path to the workflow directory
         """
@@ -118,11 +125,14 @@ class StateManager:
             "start_time": self.start_time.isoformat(),
             "status": "in_progress"
         }
-        
+        if start_url is not None:
+            metadata["start_url"] = start_url
+
+        self._metadata = metadata
         metadata_path = self.current_path / "metadata.json"
         with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
-        
+            json.dump(metadata, f, separators=(",", ":"))
+
         return self.current_path
     
     def capture_step(
@@ -139,7 +149,7 @@ class StateManager:
         Capture a single step in the workflow.
         
         Args:
-            screenshot: Screenshot of this step
+            screenshot: Screenshot of this step (PIL image or LazyScreenshot)
             description: Human-readable description
             action_type: Type of action performed
             action_target: What was acted upon
@@ -154,15 +164,22 @@ class StateManager:
             raise RuntimeError("No workflow started. Call start_workflow() first.")
         
         step_number = len(self.captured_steps) + 1
-        screenshot_filename = f"step_{step_number:02d}_{action_type}.png"
-        screenshot_path = self.current_path / screenshot_filename
-        
-        # Save screenshot
-        self.image_processor.save_image(
-            screenshot,
-            screenshot_path,
-            quality=config.screenshot_quality
-        )
+
+        # Save screenshot. Already-encoded bytes are written verbatim,
+        # skipping the PIL decode/re-encode round-trip entirely.
+        if isinstance(screenshot, LazyScreenshot):
+            extension = "jpg" if screenshot.format == "jpeg" else screenshot.format
+            screenshot_filename = f"step_{step_number:02d}_{action_type}.{extension}"
+            screenshot_path = self.current_path / screenshot_filename
+            screenshot_path.write_bytes(screenshot.raw)
+        else:
+            screenshot_filename = f"step_{step_number:02d}_{action_type}.png"
+            screenshot_path = self.current_path / screenshot_filename
+            self.image_processor.save_image(
+                screenshot,
+                screenshot_path,
+                quality=config.screenshot_quality
+            )
         
         log.info(f"Captured step {step_number}: {description}")
         
@@ -180,37 +197,35 @@ class StateManager:
         )
         
         self.captured_steps.append(step)
-        
-        # Update metadata file incrementally
-        self._update_metadata()
-        
+
+        # Step records are buffered in memory; flush periodically only when
+        # configured, so a workflow costs one metadata write, not one per step
+        if self.flush_every and len(self.captured_steps) % self.flush_every == 0:
+            self._update_metadata()
+
         return step
-    
+
     def _update_metadata(self):
-        """Update the metadata file with current progress."""
+        """Write the buffered metadata and step records to disk."""
         if not self.current_path:
             return
-        
+
         metadata_path = self.current_path / "metadata.json"
-        
+
         try:
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
-            
-            # Update with current progress
-            metadata.update({
+            self._metadata.update({
                 "total_steps": len(self.captured_steps),
                 "last_update": datetime.now().isoformat(),
                 "steps": [step.to_dict() for step in self.captured_steps]
             })
-            
+
             if self.start_time:
                 duration = (datetime.now() - self.start_time).total_seconds()
-                metadata["duration_seconds"] = duration
-            
+                self._metadata["duration_seconds"] = duration
+
             with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-                
+                json.dump(self._metadata, f, separators=(",", ":"))
+
         except Exception as e:
             log.error(f"Failed to update metadata: {e}")
     
@@ -236,11 +251,10 @@ class StateManager:
         
         log.info(f"Ending workflow: {self.current_workflow} (success={success})")
         
-        # Load metadata
+        # Buffered metadata already holds everything written so far
         metadata_path = self.current_path / "metadata.json"
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
-        
+        metadata = self._metadata
+
         # Create workflow dataset
         dataset = WorkflowDataset(
             task_id=metadata["task_id"],
@@ -255,18 +269,19 @@ class StateManager:
             error_message=error_message
         )
         
-        # Save final metadata
+        # Save final metadata, including the buffered step records
         metadata.update({
             "status": "completed" if success else "failed",
             "success": success,
             "error_message": error_message,
             "duration_seconds": duration,
             "total_steps": len(self.captured_steps),
+            "steps": [step.to_dict() for step in self.captured_steps],
             "end_time": datetime.now().isoformat()
         })
         
         with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+            json.dump(metadata, f, separators=(",", ":"))
         
         # Create a summary README
         self._create_readme(dataset)
@@ -276,7 +291,8 @@ class StateManager:
         self.current_path = None
         self.captured_steps = []
         self.start_time = None
-        
+        self._metadata = {}
+
         return dataset
     
     def _create_readme(self, dataset: WorkflowDataset):
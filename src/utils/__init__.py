@@ -2,7 +2,7 @@
 
 from .config import config, Config, AppConfig, TaskConfig
 from .logger import log, console, create_progress
-from .image_utils import ImageProcessor
+from .image_utils import ImageProcessor, LazyScreenshot
 
 __all__ = [
     'config',
@@ -12,6 +12,7 @@ __all__ = [
     'log',
     'console',
     'create_progress',
-    'ImageProcessor'
+    'ImageProcessor',
+    'LazyScreenshot'
 ]
 
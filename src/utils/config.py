@@ -24,7 +24,9 @@ class AppConfig(BaseModel):
     wait_for_navigation: float = 3.0
     page_load_timeout: int = 30000
     action_timeout: int = 7000
+    fast_typing: bool = False
     change_threshold: float = 0.15
+    block_resource_types: list = Field(default_factory=list)
     selectors: Dict[str, str] = Field(default_factory=dict)
     ignore_regions: list = Field(default_factory=list)
 
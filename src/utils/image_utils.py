@@ -4,10 +4,32 @@ import io
 import base64
 from pathlib import Path
 from typing import Tuple, Optional
-import numpy as np
 from PIL import Image
-import imagehash
-import cv2
+
+# numpy, cv2, and imagehash together add a few hundred ms of import time,
+# and the capture scripts never touch the pixel-level helpers that need
+# them — so they are imported inside those methods on first use.
+
+
+class LazyScreenshot:
+    """Screenshot held as encoded bytes, decoded to a PIL image on demand.
+
+    Most captures are stored to disk verbatim, so the expensive
+    `Image.open` decode is deferred until something actually needs pixel
+    access (hashing, diffing, annotation).
+    """
+
+    def __init__(self, raw: bytes, format: str = "png"):
+        self.raw = raw
+        self.format = format
+        self._image: Optional[Image.Image] = None
+
+    @property
+    def image(self) -> Image.Image:
+        """Decode the raw bytes, caching the resulting PIL image."""
+        if self._image is None:
+            self._image = Image.open(io.BytesIO(self.raw))
+        return self._image
 
 
 class ImageProcessor:
@@ -40,6 +62,7 @@ class ImageProcessor:
     @staticmethod
     def compute_hash(image: Image.Image, hash_size: int = 16) -> str:
         """Compute perceptual hash of an image."""
+        import imagehash
         return str(imagehash.phash(image, hash_size=hash_size))
     
     @staticmethod
@@ -48,6 +71,7 @@ class ImageProcessor:
         Compute similarity between two images using perceptual hashing.
         Returns a value between 0 (completely different) and 1 (identical).
         """
+        import imagehash
         hash1 = imagehash.phash(image1)
         hash2 = imagehash.phash(image2)
         
@@ -67,6 +91,9 @@ class ImageProcessor:
         Compute structural similarity (SSIM) between two images.
         More accurate but slower than hash-based comparison.
         """
+        import cv2
+        import numpy as np
+
         # Convert to numpy arrays
         img1_array = np.array(image1.convert('L'))
         img2_array = np.array(image2.convert('L'))
@@ -119,6 +146,9 @@ class ImageProcessor:
         """
         Create a visual diff image highlighting changes between two images.
         """
+        import cv2
+        import numpy as np
+
         # Convert to numpy arrays
         img1_array = np.array(image1.convert('RGB'))
         img2_array = np.array(image2.convert('RGB'))
@@ -198,6 +228,9 @@ class ImageProcessor:
         thickness: int = 3
     ) -> Image.Image:
         """Draw a bounding box around an element on the image."""
+        import cv2
+        import numpy as np
+
         img_array = np.array(image)
         cv2.rectangle(
             img_array,
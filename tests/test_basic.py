@@ -7,7 +7,7 @@ import sys
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from utils import config, ImageProcessor
+from utils import config, ImageProcessor, LazyScreenshot
 from core import Action
 
 
@@ -34,6 +34,21 @@ def test_image_processor():
     assert processor is not None
 
 
+def test_lazy_screenshot():
+    """Test that LazyScreenshot defers decoding until pixels are needed."""
+    import io
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), "red").save(buffer, format="JPEG")
+    shot = LazyScreenshot(buffer.getvalue(), format="jpeg")
+
+    assert shot.raw == buffer.getvalue()
+    assert shot._image is None  # no decode yet
+    assert shot.image.size == (4, 4)
+    assert shot.image is shot.image  # decoded once, then cached
+
+
 def test_action_creation():
     """Test Action object creation."""
     action = Action(
@@ -50,6 +65,18 @@ def test_action_creation():
     assert action_dict["action_type"] == "click"
 
 
+def test_get_adapter_unknown_app():
+    """Apps without a registered adapter get a usable fallback."""
+    from adapters import get_adapter, GenericAdapter
+    from utils import AppConfig
+
+    cfg = AppConfig(name="asana", base_url="https://app.asana.com")
+    adapter = get_adapter("asana", cfg)
+    assert isinstance(adapter, GenericAdapter)
+    assert adapter.get_base_url() == "https://app.asana.com"
+    assert adapter.storage_state_path().name == "asana.json"
+
+
 def test_dataset_directory_exists():
     """Test that dataset directory exists."""
     assert config.dataset_dir.exists()